@@ -1,8 +1,12 @@
+import asyncio
+import contextlib
 import httpx
 import json
 import logging
+import sys
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
 from urllib.parse import urlparse
 
 from ..config.settings import settings
@@ -12,6 +16,51 @@ logging.getLogger("httpx").setLevel(logging.WARNING)
 
 logger = logging.getLogger(__name__)
 
+# Debug output is configured once via the environment; read the flag at import
+# so the request path doesn't format debug strings when it is off.
+_DEBUG_ENABLED = bool(getattr(settings, "ENABLE_DEBUG_MESSAGES", False))
+
+# Process-wide HTTP clients, one per timeout value, so API calls reuse pooled
+# keep-alive connections instead of opening a new connection (and TLS
+# handshake) per call. Maps timeout -> (owning event loop, client).
+_HTTP_CLIENTS: Dict[Optional[float], Tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = {}
+
+
+@contextlib.asynccontextmanager
+async def _http_client(timeout: Optional[float] = None) -> AsyncIterator[httpx.AsyncClient]:
+    """
+    Yield the shared httpx client for the given timeout (None = httpx default).
+
+    API clients are per-request, so the shared client must not carry any
+    per-user state: credentials are always sent per call via headers, and its
+    cookie jar refuses every cookie. The client is left open for reuse.
+    """
+    loop = asyncio.get_running_loop()
+    entry = _HTTP_CLIENTS.get(timeout)
+    if entry is None or entry[0] is not loop or entry[1].is_closed:
+        if entry is not None and not entry[1].is_closed:
+            # Left behind by an earlier event loop; close it rather than leak
+            # its connection pool
+            try:
+                await entry[1].aclose()
+            except Exception as e:
+                logger.debug(f"Failed to close stale HTTP client: {e}")
+        kwargs: Dict[str, Any] = {"cookies": CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))}
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+        entry = _HTTP_CLIENTS[timeout] = (loop, httpx.AsyncClient(**kwargs))
+    yield entry[1]
+
+
+async def close_http_clients() -> None:
+    """Close the shared HTTP clients owned by the running event loop."""
+    loop = asyncio.get_running_loop()
+    for timeout, (owner, client) in list(_HTTP_CLIENTS.items()):
+        if owner is loop:
+            del _HTTP_CLIENTS[timeout]
+            await client.aclose()
+
+
 class InsightFinderAPIClient:
     """
     A client for interacting with the InsightFinder API.
@@ -51,7 +100,7 @@ class InsightFinderAPIClient:
         }
         
         try:
-            async with httpx.AsyncClient() as client:
+            async with _http_client() as client:
                 response = await client.get(
                     url,
                     params=params,
@@ -102,7 +151,7 @@ class InsightFinderAPIClient:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with _http_client(30.0) as client:
                 response = await client.get(url, params=params)
                 response.raise_for_status()
                 if not response.text or not response.text.strip():
@@ -143,6 +192,42 @@ class InsightFinderAPIClient:
         Returns:
             A dictionary containing the recommendation data or None if not available
         """
+        async with _http_client() as client:
+            return await self._request_recommendation(client, incident_llm_key, customer_name)
+
+    async def fetch_recommendations(
+        self,
+        requests: List[Tuple[Dict[str, Any], str]],
+        max_concurrency: int = 8
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Fetch recommendations for several incidents.
+
+        The API has no bulk recommendation endpoint, so this still issues one
+        request per incident, concurrently over the shared HTTP client.
+
+        Args:
+            requests: (incidentLLMKey, customer_name) pairs
+            max_concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            One recommendation (or None) per request, in the same order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        async with _http_client() as client:
+            async def fetch(incident_llm_key: Dict[str, Any], customer_name: str) -> Optional[Dict[str, Any]]:
+                async with semaphore:
+                    return await self._request_recommendation(client, incident_llm_key, customer_name)
+
+            return await asyncio.gather(*(fetch(key, customer) for key, customer in requests))
+
+    async def _request_recommendation(
+        self,
+        client: httpx.AsyncClient,
+        incident_llm_key: Dict[str, Any],
+        customer_name: str
+    ) -> Optional[Dict[str, Any]]:
+        """Issue one recommendation request on the given client; None on any error."""
         api_path = "/api/v2/timeline-detail"
         url = f"{self.base_url}{api_path}"
         
@@ -153,24 +238,23 @@ class InsightFinderAPIClient:
         }
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    url,
-                    params=params,
-                    headers=self.headers
-                )
-                response.raise_for_status()
-                # Defensive: check if response is empty or not JSON
-                if not response.text or not response.text.strip():
-                    logger.warning(f"Empty response when fetching recommendations for incidentLLMKey: {incident_llm_key}")
-                    return None
-                try:
-                    data = response.json()
-                except Exception as json_err:
-                    logger.warning(f"Non-JSON response when fetching recommendations: {response.text[:200]}")
-                    return None
-                # print(f"[DEBUG] Recommendations fetched: {data.get('recommendation', {}).get('response')}")
-                return data.get("recommendation", {}).get("response")
+            response = await client.get(
+                url,
+                params=params,
+                headers=self.headers
+            )
+            response.raise_for_status()
+            # Defensive: check if response is empty or not JSON
+            if not response.text or not response.text.strip():
+                logger.warning(f"Empty response when fetching recommendations for incidentLLMKey: {incident_llm_key}")
+                return None
+            try:
+                data = response.json()
+            except Exception as json_err:
+                logger.warning(f"Non-JSON response when fetching recommendations: {response.text[:200]}")
+                return None
+            # print(f"[DEBUG] Recommendations fetched: {data.get('recommendation', {}).get('response')}")
+            return data.get("recommendation", {}).get("response")
         except Exception as e:
             logger.warning(f"Error fetching recommendations: {str(e)}")
             return None
@@ -204,12 +288,13 @@ class InsightFinderAPIClient:
             "timelineEventType": timeline_event_type
         }
 
-        print(f"Fetching {timeline_event_type} data for {system_name} from {self.base_url} with params: {params}")
-        
-        # Debug: Display human-readable time range (timestamps are wall-clock in owner timezone)
-        start_time_readable = datetime.fromtimestamp(start_time_ms / 1000, tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
-        end_time_readable = datetime.fromtimestamp(end_time_ms / 1000, tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
-        print(f"DEBUG: Time range - Start: {start_time_readable}, End: {end_time_readable} (Owner Timezone)")
+        if _DEBUG_ENABLED:
+            print(f"Fetching {timeline_event_type} data for {system_name} from {self.base_url} with params: {params}", file=sys.stderr)
+
+            # Debug: Display human-readable time range (timestamps are wall-clock in owner timezone)
+            start_time_readable = datetime.fromtimestamp(start_time_ms / 1000, tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+            end_time_readable = datetime.fromtimestamp(end_time_ms / 1000, tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+            print(f"DEBUG: Time range - Start: {start_time_readable}, End: {end_time_readable} (Owner Timezone)", file=sys.stderr)
 
         # Basic input validation
         if not system_name or len(system_name) > 100:
@@ -218,9 +303,7 @@ class InsightFinderAPIClient:
         if end_time_ms - start_time_ms > 365 * 24 * 60 * 60 * 1000:  # Max 1 year
             return {"status": "error", "message": "Time range too large (max 1 year)"}
 
-        print(f"Fetching {timeline_event_type} data for {system_name} from {self.base_url} with params: {params}")
-
-        async with httpx.AsyncClient(timeout=60.0) as client:  # Increased timeout to 60 seconds
+        async with _http_client(60.0) as client:  # Increased timeout to 60 seconds
             try:
                 response = await client.get(url, params=params, headers=self.headers)
                 response.raise_for_status()
@@ -247,7 +330,8 @@ class InsightFinderAPIClient:
                 if len(consolidated_list) > 5000:
                     consolidated_list = consolidated_list[:5000]
 
-                print(f"Successfully fetched {len(timeline_list)} {timeline_event_type} records for {system_name} ({len(consolidated_list)} consolidated)")
+                if _DEBUG_ENABLED:
+                    print(f"Successfully fetched {len(timeline_list)} {timeline_event_type} records for {system_name} ({len(consolidated_list)} consolidated)", file=sys.stderr)
 
                 return {
                     "status": "success",
@@ -259,22 +343,26 @@ class InsightFinderAPIClient:
             except httpx.HTTPStatusError as e:
                 error_msg = f"API error {e.response.status_code} for {timeline_event_type}: {str(e)}"
                 logger.error(error_msg)
-                print(f"ERROR: {error_msg}")
+                if _DEBUG_ENABLED:
+                    print(f"ERROR: {error_msg}", file=sys.stderr)
                 return {"status": "error", "message": f"API request failed: {e.response.status_code}"}
             except httpx.TimeoutException as e:
                 error_msg = f"Timeout error for {timeline_event_type}: {str(e)}"
                 logger.error(error_msg)
-                print(f"ERROR: {error_msg}")
+                if _DEBUG_ENABLED:
+                    print(f"ERROR: {error_msg}", file=sys.stderr)
                 return {"status": "error", "message": "Request timeout - API took too long to respond"}
             except httpx.RequestError as e:
                 error_msg = f"Network error for {timeline_event_type}: {str(e)}"
                 logger.error(error_msg)
-                print(f"ERROR: {error_msg}")
+                if _DEBUG_ENABLED:
+                    print(f"ERROR: {error_msg}", file=sys.stderr)
                 return {"status": "error", "message": f"Network error: {str(e)}"}
             except Exception as e:
                 error_msg = f"Unexpected error in {timeline_event_type}: {str(e)}"
                 logger.error(error_msg)
-                print(f"ERROR: {error_msg}")
+                if _DEBUG_ENABLED:
+                    print(f"ERROR: {error_msg}", file=sys.stderr)
                 return {"status": "error", "message": f"Internal error: {str(e)}"}
 
     async def get_incidents(
@@ -398,9 +486,10 @@ class InsightFinderAPIClient:
             "predict": "true"
         }
         
-        start_time_readable = datetime.fromtimestamp(start_time_ms / 1000, tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
-        end_time_readable = datetime.fromtimestamp(end_time_ms / 1000, tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
-        print(f"DEBUG: Time range - Start: {start_time_readable}, End: {end_time_readable} (Owner Timezone)")
+        if _DEBUG_ENABLED:
+            start_time_readable = datetime.fromtimestamp(start_time_ms / 1000, tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+            end_time_readable = datetime.fromtimestamp(end_time_ms / 1000, tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+            print(f"DEBUG: Time range - Start: {start_time_readable}, End: {end_time_readable} (Owner Timezone)", file=sys.stderr)
 
         # Basic input validation
         if not system_name or len(system_name) > 100:
@@ -409,7 +498,7 @@ class InsightFinderAPIClient:
         if end_time_ms - start_time_ms > 365 * 24 * 60 * 60 * 1000:  # Max 1 year
             return {"status": "error", "message": "Time range too large (max 1 year)"}
 
-        async with httpx.AsyncClient(timeout=30.0) as client:  # Shorter timeout
+        async with _http_client(30.0) as client:  # Shorter timeout
             try:
                 response = await client.get(url, params=params, headers=self.headers)
                 response.raise_for_status()
@@ -460,7 +549,7 @@ class InsightFinderAPIClient:
         params = {"customerName": self.user_name, "needDetail": "false", "tzOffset": "-18000000"}
         headers = {"X-User-Name": self.user_name, "X-API-Key": self.license_key}
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with _http_client(30.0) as client:
                 response = await client.get(url, params=params, headers=headers)
                 response.raise_for_status()
                 data = response.json()
@@ -513,7 +602,7 @@ class InsightFinderAPIClient:
         }
         headers = {"X-User-Name": self.user_name, "X-API-Key": self.license_key}
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with _http_client(30.0) as client:
                 response = await client.post(url, data=body, headers=headers)
                 response.raise_for_status()
                 data = response.json()
@@ -551,7 +640,7 @@ class InsightFinderAPIClient:
         }
         
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with _http_client(30.0) as client:
                 response = await client.get(
                     url,
                     params=params,
@@ -604,7 +693,7 @@ class InsightFinderAPIClient:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
+            async with _http_client(15.0) as client:
                 response = await client.get(url, params=params, headers=headers)
                 response.raise_for_status()
                 data = response.json()
@@ -670,12 +759,13 @@ class InsightFinderAPIClient:
             "X-API-Key": self.license_key
         }
         
-        print(f"DEBUG: Fetching system framework for project '{project_name}'")
-        print(f"DEBUG: System framework URL: {url}")
-        print(f"DEBUG: System framework params: {params}")
+        if _DEBUG_ENABLED:
+            print(f"DEBUG: Fetching system framework for project '{project_name}'", file=sys.stderr)
+            print(f"DEBUG: System framework URL: {url}", file=sys.stderr)
+            print(f"DEBUG: System framework params: {params}", file=sys.stderr)
         
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with _http_client(30.0) as client:
                 response = await client.get(
                     url,
                     params=params,
@@ -826,9 +916,10 @@ class InsightFinderAPIClient:
                    f"metrics={metric_list}, customer={customer_name}")
         
         # Debug: Display human-readable time range (timestamps are wall-clock in owner timezone)
-        start_time_readable = datetime.fromtimestamp(start_time_ms / 1000, tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
-        end_time_readable = datetime.fromtimestamp(end_time_ms / 1000, tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
-        print(f"DEBUG: Metric data time range - Start: {start_time_readable}, End: {end_time_readable} (Owner Timezone)")
+        if _DEBUG_ENABLED:
+            start_time_readable = datetime.fromtimestamp(start_time_ms / 1000, tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+            end_time_readable = datetime.fromtimestamp(end_time_ms / 1000, tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+            print(f"DEBUG: Metric data time range - Start: {start_time_readable}, End: {end_time_readable} (Owner Timezone)", file=sys.stderr)
         # print(f"DEBUG: Metric data customer: {customer_name} (logged-in user: {self.user_name})")
         # print(f"DEBUG: Metric data API URL: {url}")
         # print(f"DEBUG: Metric data params: {params}")
@@ -861,7 +952,7 @@ class InsightFinderAPIClient:
             query_string = urlencode(params)
             full_url = f"{url}?{query_string}"
             
-            async with httpx.AsyncClient(timeout=60.0) as client:  # Longer timeout for potentially large data
+            async with _http_client(60.0) as client:  # Longer timeout for potentially large data
                 response = await client.get(
                     url,
                     params=params,
@@ -946,7 +1037,7 @@ class InsightFinderAPIClient:
             return {"status": "error", "message": "project_name is required"}
         
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with _http_client(30.0) as client:
                 response = await client.get(
                     url,
                     params=params,
@@ -1001,7 +1092,7 @@ class InsightFinderAPIClient:
         }
         headers = {"X-User-Name": self.user_name, "X-API-Key": self.license_key}
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
+            async with _http_client(60.0) as client:
                 response = await client.get(url, params=params, headers=headers)
                 response.raise_for_status()
                 return response.json()
@@ -1063,7 +1154,7 @@ class InsightFinderAPIClient:
 
         headers = {"X-User-Name": self.user_name, "X-API-Key": self.license_key}
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
+            async with _http_client(60.0) as client:
                 response = await client.post(url, data=body, headers=headers)
                 response.raise_for_status()
                 return response.json()
@@ -1092,7 +1183,7 @@ class InsightFinderAPIClient:
         }
         headers = {"X-User-Name": self.user_name, "X-API-Key": self.license_key}
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
+            async with _http_client(60.0) as client:
                 response = await client.get(url, params=params, headers=headers)
                 response.raise_for_status()
                 return response.json()
@@ -1125,7 +1216,7 @@ class InsightFinderAPIClient:
         }
         headers = {"X-User-Name": self.user_name, "X-API-Key": self.license_key}
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
+            async with _http_client(60.0) as client:
                 response = await client.get(url, params=params, headers=headers)
                 response.raise_for_status()
                 return response.json()
@@ -1199,7 +1290,7 @@ class InsightFinderAPIClient:
 
         headers = {"X-User-Name": self.user_name, "X-API-Key": self.license_key}
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
+            async with _http_client(60.0) as client:
                 response = await client.post(url, data=body, headers=headers)
                 response.raise_for_status()
                 return response.json()
@@ -1270,7 +1361,7 @@ class InsightFinderAPIClient:
             from urllib.parse import urlencode
             query_string = urlencode(params, safe="")
             full_url = f"{url}?{query_string}"
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with _http_client(30.0) as client:
                 # Send as POST with all parameters in URL (no body) matching provided pattern
                 response = await client.post(full_url, headers=self.headers)
                 # Some older endpoints may return 200 even on logical failure; capture body
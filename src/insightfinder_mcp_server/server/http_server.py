@@ -10,6 +10,14 @@ from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from sse_starlette.sse import EventSourceResponse
 import json
 import logging
+import math
+
+try:
+    # Faster encoder for tool results and JSON-RPC responses
+    import orjson
+except ImportError:
+    orjson = None
+
 from ..config.settings import settings
 from ..security import security_manager, AuthenticationError, AuthorizationError, RateLimitError
 from ..api_client.client_factory import (
@@ -17,10 +25,23 @@ from ..api_client.client_factory import (
     set_request_context, 
     clear_request_context
 )
+from ..api_client.insightfinder_client import close_http_clients
 from .server import mcp_server
 
 logger = logging.getLogger(__name__)
 
+
+def _non_finite_to_none(obj):
+    """Copy obj with NaN/Infinity floats replaced by None, the way orjson encodes them."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _non_finite_to_none(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_non_finite_to_none(value) for value in obj]
+    return obj
+
+
 class HTTPMCPServer:
     """
     HTTP MCP Server that provides streaming JSON-RPC over HTTP with SSE support.
@@ -349,7 +370,7 @@ class HTTPMCPServer:
                 response = await self.process_mcp_request(rpc_request, request)
                 
                 return Response(
-                    content=json.dumps(response, default=self.json_serializer),
+                    content=self.dumps_json(response),
                     media_type="application/json"
                 )
                 
@@ -417,7 +438,7 @@ class HTTPMCPServer:
                 async def generate_response():
                     """Generate streaming response."""
                     response = await self.process_mcp_request(rpc_request, request)
-                    yield f"data: {json.dumps(response, default=self.json_serializer)}\n\n"
+                    yield f"data: {self.dumps_json(response)}\n\n"
                 
                 return StreamingResponse(
                     generate_response(),
@@ -1011,7 +1032,7 @@ class HTTPMCPServer:
                             "content": [
                                 {
                                     "type": "text",
-                                    "text": json.dumps(result, default=self.json_serializer, indent=2)
+                                    "text": self.dumps_json(result, indent=True)
                                 }
                             ]
                         }
@@ -1141,6 +1162,30 @@ class HTTPMCPServer:
         if hasattr(obj, 'isoformat'):
             return obj.isoformat()
         raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
+
+    def dumps_json(self, obj, indent: bool = False) -> str:
+        """
+        Serialize a payload with orjson, falling back to the stdlib encoder.
+
+        The fallback is set up to write what orjson writes: non-ASCII text as
+        UTF-8 rather than \\u escapes, compact separators unless indented, and
+        NaN/Infinity as null.
+        """
+        if orjson is not None:
+            option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+            try:
+                return orjson.dumps(obj, default=self.json_serializer, option=option).decode()
+            except TypeError:
+                pass  # e.g. integers beyond 64 bits; let the stdlib encoder handle it
+        kwargs = {"default": self.json_serializer, "ensure_ascii": False}
+        if indent:
+            kwargs["indent"] = 2
+        else:
+            kwargs["separators"] = (",", ":")
+        try:
+            return json.dumps(obj, allow_nan=False, **kwargs)
+        except ValueError:
+            return json.dumps(_non_finite_to_none(obj), **kwargs)
     
     async def run(self):
         """Run the HTTP server."""
@@ -1201,7 +1246,10 @@ class HTTPMCPServer:
 
         print("=" * 60, file=sys.stderr)
         
-        await server.serve()
+        try:
+            await server.serve()
+        finally:
+            await close_http_clients()
 
 # Create server instance
 http_server = HTTPMCPServer()
@@ -1,15 +1,27 @@
+import contextlib
+
 from mcp.server.fastmcp import FastMCP
 from ..config.settings import settings
+from ..api_client.insightfinder_client import close_http_clients
 
 class CustomFastMCP(FastMCP):
     def __init__(self, *args, version=None, **kwargs):
         super().__init__(*args, **kwargs)
         self.version = version
 
+@contextlib.asynccontextmanager
+async def _server_lifespan(server):
+    """Close the shared HTTP clients when a FastMCP transport (e.g. stdio) shuts down."""
+    try:
+        yield {}
+    finally:
+        await close_http_clients()
+
 # Create a singleton instance of the FastMCP server
 mcp_server = CustomFastMCP(
     name=settings.SERVER_NAME,
-    version=settings.SERVER_VERSION
+    version=settings.SERVER_VERSION,
+    lifespan=_server_lifespan
 )
 
 # Import tool definitions to ensure they are registered with the server instance
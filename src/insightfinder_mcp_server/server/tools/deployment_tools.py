@@ -21,10 +21,12 @@ infrastructure modifications, etc.
 """
 
 import asyncio
+import heapq
 import json
 import logging
 from typing import Dict, Any, List, Optional, Union
 from datetime import datetime, timezone
+from operator import itemgetter
 import re
 
 from ..server import mcp_server
@@ -213,7 +215,7 @@ async def get_deployments_overview(
             if job_type:
                 job_type_counts[job_type] = job_type_counts.get(job_type, 0) + 1
         
-        top_job_types = sorted(job_type_counts.items(), key=lambda x: x[1], reverse=True)[:3]
+        top_job_types = sorted(job_type_counts.items(), key=itemgetter(1), reverse=True)[:3]
         
         return {
             "status": "success",
@@ -593,7 +595,7 @@ async def get_deployments_statistics(
         
         # Calculate percentages and top items
         def get_top_items(counts_dict, top_n=5):
-            sorted_items = sorted(counts_dict.items(), key=lambda x: x[1], reverse=True)
+            sorted_items = sorted(counts_dict.items(), key=itemgetter(1), reverse=True)
             return {
                 item: {"count": count, "percentage": round(count / total_deployments * 100, 1)}
                 for item, count in sorted_items[:top_n]
@@ -756,10 +758,11 @@ async def get_project_deployments(
         
         # Filter by the specific project name
         # project_deployments = [d for d in deployments if d.get("projectName") == project_name]
-        project_deployments = [d for d in deployments if d.get("projectName", "").lower() == project_name.lower() or d.get("projectDisplayName", "").lower() == project_name.lower()]
+        project_name_lower = project_name.lower()
+        project_deployments = (d for d in deployments if d.get("projectName", "").lower() == project_name_lower or d.get("projectDisplayName", "").lower() == project_name_lower)
         
-        # Sort by timestamp (most recent first) and limit
-        project_deployments = sorted(project_deployments, key=lambda x: x.get("timestamp", 0), reverse=True)[:limit]
+        # Most recent first, limited; nlargest avoids sorting every match
+        project_deployments = heapq.nlargest(limit, project_deployments, key=lambda x: x.get("timestamp", 0))
 
         # Create detailed deployment list for the project
         deployment_list = []
@@ -27,11 +27,15 @@ How timezone is resolved:
     4. If neither has data, default to UTC
 """
 
+import asyncio
 import calendar
+import functools
 import json
 import logging
 import re
+import time
 import zoneinfo
+from collections import OrderedDict
 from datetime import datetime, timezone, timedelta
 from typing import Optional, Tuple, Any, Union
 
@@ -41,6 +45,17 @@ from ...api_client.client_factory import get_current_api_client
 logger = logging.getLogger(__name__)
 
 _FALLBACK_TZ = "UTC"
+_DAY_MS = 86_400_000
+_EPOCH_NAIVE = datetime(1970, 1, 1)
+_ONE_SECOND = timedelta(seconds=1)
+
+# resolve_system_timezone results, keyed by (user_name, base_url, system_name)
+# -> (tz_name, resolved_system_name, monotonic timestamp). Lock entries are
+# [lock, number of callers using it] and are dropped when the count hits 0.
+_SYSTEM_TZ_TTL_S = 300
+_SYSTEM_TZ_CACHE_MAX = 256
+_SYSTEM_TZ_CACHE: "OrderedDict[tuple, tuple]" = OrderedDict()
+_SYSTEM_TZ_LOCKS: dict[tuple, list] = {}
 
 # Legacy timezone names that Python's zoneinfo may not recognize without the
 # `tzdata` package.  InsightFinder's API frequently returns these.
@@ -84,6 +99,7 @@ _LEGACY_TZ_MAP: dict[str, str] = {
 }
 
 
+@functools.lru_cache(maxsize=64)
 def _normalize_tz(tz_name: str) -> Optional[str]:
     """
     Validate and normalize a timezone name.
@@ -91,6 +107,9 @@ def _normalize_tz(tz_name: str) -> Optional[str]:
     Tries the name directly with zoneinfo first.  If that fails, checks the
     legacy mapping.  Returns the working IANA timezone string, or None if
     the name is unrecognizable.
+
+    Cached: zoneinfo caches zones it finds but not failed lookups, and each
+    miss searches the tz database on disk (~150us).
     """
     if not tz_name:
         return None
@@ -120,44 +139,12 @@ async def _fetch_owner_timezone_from_api() -> str:
     """
     Fetch the owner user timezone from the systemframework API.
     Resolution: ownSystemArr first, then shareSystemArr, then UTC.
-    """
-    api_client = get_current_api_client()
-    if not api_client:
-        logger.warning("No API client available - falling back to UTC")
-        return _FALLBACK_TZ
-
-    try:
-        framework_data = await api_client.get_system_framework()
-        if framework_data.get("status") != "success":
-            logger.warning("System framework API error - falling back to UTC")
-            return _FALLBACK_TZ
-
-        for system_json_str in framework_data.get("ownSystemArr", []):
-            try:
-                system = json.loads(system_json_str) if isinstance(system_json_str, str) else system_json_str
-                tz = system.get("timezone")
-                if tz:
-                    normalized = _normalize_tz(tz)
-                    if normalized:
-                        return normalized
-            except (json.JSONDecodeError, KeyError):
-                continue
 
-        for system_json_str in framework_data.get("shareSystemArr", []):
-            try:
-                system = json.loads(system_json_str) if isinstance(system_json_str, str) else system_json_str
-                tz = system.get("timezone")
-                if tz:
-                    normalized = _normalize_tz(tz)
-                    if normalized:
-                        return normalized
-            except (json.JSONDecodeError, KeyError):
-                continue
-
-    except Exception as e:
-        logger.warning(f"Error fetching owner timezone: {e} - falling back to UTC")
-
-    return _FALLBACK_TZ
+    This is resolve_system_timezone() without a system name, so it shares
+    that function's per-credential TTL cache.
+    """
+    tz_name, _ = await resolve_system_timezone(None)
+    return tz_name
 
 
 async def resolve_system_timezone(system_name: Optional[str] = None) -> Tuple[str, str]:
@@ -181,11 +168,62 @@ async def resolve_system_timezone(system_name: Optional[str] = None) -> Tuple[st
         logger.warning("resolve_system_timezone: No API client available")
         return _FALLBACK_TZ, original_name
 
+    # Cache per credentials as well as system name: the API client is
+    # per-request and different users may see different systems.
+    key = (api_client.user_name, api_client.base_url, original_name)
+
+    def _lookup():
+        cached = _SYSTEM_TZ_CACHE.get(key)
+        if cached and time.monotonic() - cached[2] < _SYSTEM_TZ_TTL_S:
+            _SYSTEM_TZ_CACHE.move_to_end(key)
+            return cached[0], cached[1]
+        return None
+
+    cached = _lookup()
+    if cached is not None:
+        return cached
+
+    # Coalesce concurrent lookups for the same key into one API call
+    lock_entry = _SYSTEM_TZ_LOCKS.get(key)
+    if lock_entry is None:
+        lock_entry = _SYSTEM_TZ_LOCKS[key] = [asyncio.Lock(), 0]
+    lock_entry[1] += 1
+    try:
+        async with lock_entry[0]:
+            cached = _lookup()
+            if cached is not None:
+                return cached
+
+            tz_name, resolved_name, cacheable = await _resolve_system_timezone_uncached(api_client, system_name)
+            if cacheable:
+                _SYSTEM_TZ_CACHE[key] = (tz_name, resolved_name, time.monotonic())
+                _SYSTEM_TZ_CACHE.move_to_end(key)
+                while len(_SYSTEM_TZ_CACHE) > _SYSTEM_TZ_CACHE_MAX:
+                    _SYSTEM_TZ_CACHE.popitem(last=False)
+            else:
+                # Don't keep serving a stale entry after an error response
+                _SYSTEM_TZ_CACHE.pop(key, None)
+            return tz_name, resolved_name
+    finally:
+        lock_entry[1] -= 1
+        if not lock_entry[1]:
+            del _SYSTEM_TZ_LOCKS[key]
+
+
+async def _resolve_system_timezone_uncached(api_client, system_name: Optional[str]) -> Tuple[str, str, bool]:
+    """
+    Look up (tz_name, resolved_system_name) from the API.
+
+    The flag says whether the result may be cached: it is False on API errors
+    and when system_name matched no system, so unknown names aren't kept.
+    """
+    original_name = system_name or ""
+    cacheable = True
     try:
         framework_data = await api_client.get_system_framework()
         if framework_data.get("status") != "success":
             logger.warning("resolve_system_timezone: System framework API returned non-success")
-            return _FALLBACK_TZ, original_name
+            return _FALLBACK_TZ, original_name, False
 
         all_systems_json = framework_data.get("ownSystemArr", []) + framework_data.get("shareSystemArr", [])
 
@@ -206,10 +244,10 @@ async def resolve_system_timezone(system_name: Optional[str] = None) -> Tuple[st
                                     system_name, resolved_name, tz)
                         normalized = _normalize_tz(tz)
                         if normalized:
-                            return normalized, resolved_name
+                            return normalized, resolved_name, True
                         else:
                             logger.warning("resolve_system_timezone: Unrecognized timezone '%s' for system '%s'", tz, system_name)
-                            return _FALLBACK_TZ, resolved_name
+                            return _FALLBACK_TZ, resolved_name, True
                 except (json.JSONDecodeError, TypeError):
                     continue
 
@@ -245,13 +283,14 @@ async def resolve_system_timezone(system_name: Optional[str] = None) -> Tuple[st
                                     system_name, resolved_name, tz)
                         normalized = _normalize_tz(tz)
                         if normalized:
-                            return normalized, resolved_name
+                            return normalized, resolved_name, True
                         else:
-                            return _FALLBACK_TZ, resolved_name
+                            return _FALLBACK_TZ, resolved_name, True
                 except (json.JSONDecodeError, TypeError):
                     continue
 
             logger.warning("resolve_system_timezone: System '%s' not found even by fuzzy match", system_name)
+            cacheable = False
 
         # No specific system or not found - return owner default
         for system_json_str in framework_data.get("ownSystemArr", []):
@@ -261,7 +300,7 @@ async def resolve_system_timezone(system_name: Optional[str] = None) -> Tuple[st
                 if tz:
                     normalized = _normalize_tz(tz)
                     if normalized:
-                        return normalized, original_name
+                        return normalized, original_name, cacheable
             except Exception:
                 continue
 
@@ -272,32 +311,48 @@ async def resolve_system_timezone(system_name: Optional[str] = None) -> Tuple[st
                 if tz:
                     normalized = _normalize_tz(tz)
                     if normalized:
-                        return normalized, original_name
+                        return normalized, original_name, cacheable
             except Exception:
                 continue
 
     except Exception as e:
         logger.warning(f"Error resolving timezone for system '{system_name}': {e}")
+        return _FALLBACK_TZ, original_name, False
 
-    return _FALLBACK_TZ, original_name
+    return _FALLBACK_TZ, original_name, cacheable
 
 
 # ---------------------------------------------------------------------------
 # Public utility functions used by all tool modules
 # ---------------------------------------------------------------------------
 
+# Names that resolve to plain UTC; these map to the timezone.utc singleton so
+# callers can skip conversions with an identity check.
+_UTC_NAMES = frozenset({"UTC", "Etc/UTC", "Etc/UCT", "UCT", "Universal", "Etc/Universal", "Zulu", "Etc/Zulu"})
+
+
+@functools.lru_cache(maxsize=64)
 def _make_tz(tz_name: str):
-    """Create a ZoneInfo object, normalizing legacy names and falling back to UTC on error."""
+    """Create a tzinfo, normalizing legacy names and falling back to UTC on error.
+
+    UTC names return the ``timezone.utc`` singleton instead of a ZoneInfo.
+    Cached: a request resolves the same few names over and over, and
+    normalizing a legacy name costs a failed ZoneInfo lookup each time.
+    """
     normalized = _normalize_tz(tz_name)
-    if normalized:
-        return zoneinfo.ZoneInfo(normalized)
-    return zoneinfo.ZoneInfo("UTC")
+    if not normalized or normalized in _UTC_NAMES:
+        return timezone.utc
+    return zoneinfo.ZoneInfo(normalized)
 
 
+@functools.lru_cache(maxsize=4096)
 def format_timestamp_for_display(timestamp_ms: int, tz_name: str) -> str:
     """
     Format a 13-digit millisecond timestamp for human display.
 
+    Memoized: tools keep formatting the same window endpoints and incident
+    timestamps across a drill-down, and the result depends only on the args.
+
     IMPORTANT: InsightFinder timestamps are NOT real UTC epochs.
     They represent wall-clock time in the Owner User Timezone, stored
     as if that wall-clock time were UTC.  So we just read the UTC
@@ -311,9 +366,18 @@ def format_timestamp_for_display(timestamp_ms: int, tz_name: str) -> str:
         Formatted string like "2026-02-12 14:30:00 (US/Eastern)"
     """
     timestamp_ms = int(timestamp_ms) if isinstance(timestamp_ms, str) else timestamp_ms
-    # Read the epoch as UTC — that gives us the owner's wall-clock time directly
-    dt = datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc)
-    return f"{dt.strftime('%Y-%m-%d %H:%M:%S')} ({tz_name})"
+    epoch_s = int(timestamp_ms // 1000)
+    # Distinct timestamps mostly share a minute with others, so only the
+    # seconds are formatted per call; the date/hour/minute prefix is cached.
+    return f"{_minute_prefix(epoch_s // 60)}{epoch_s % 60:02d} ({tz_name})"
+
+
+@functools.lru_cache(maxsize=4096)
+def _minute_prefix(epoch_minute: int) -> str:
+    """Return "YYYY-MM-DD HH:MM:" for a minute since the epoch, read as UTC."""
+    # Read the epoch as UTC — that gives us the owner's wall-clock time directly.
+    # gmtime() builds the broken-down time in one step, without an aware datetime.
+    return time.strftime('%Y-%m-%d %H:%M:', time.gmtime(epoch_minute * 60))
 
 
 def _wall_clock_to_fake_utc_ms(dt_aware: datetime) -> int:
@@ -326,8 +390,9 @@ def _wall_clock_to_fake_utc_ms(dt_aware: datetime) -> int:
 
     Example: 2026-02-12 00:00:00 EST  ->  epoch for 2026-02-12 00:00:00 UTC
     """
-    naive = dt_aware.replace(tzinfo=None)
-    return int(calendar.timegm(naive.timetuple()) * 1000)
+    # Floor-dividing the naive offset from the epoch gives the same whole
+    # seconds as calendar.timegm(timetuple()) without building a struct_time.
+    return (dt_aware.replace(tzinfo=None) - _EPOCH_NAIVE) // _ONE_SECOND * 1000
 
 
 def get_time_range_ms(tz_name: str, days_back: int = 1) -> Tuple[int, int]:
@@ -393,7 +458,7 @@ def parse_user_datetime_to_ms(input_str: str, user_tz_name: str) -> int:
             parsed = input_str[:-1] + "+00:00"
             dt_utc = datetime.fromisoformat(parsed.replace(" ", "T", 1))
             # Convert UTC wall-clock to owner tz wall-clock, then fake-UTC-encode
-            dt_local = dt_utc.astimezone(tz)
+            dt_local = dt_utc if tz is timezone.utc else dt_utc.astimezone(tz)
             return _wall_clock_to_fake_utc_ms(dt_local)
         except ValueError:
             pass
@@ -545,27 +610,35 @@ async def get_current_datetime() -> str:
     Returns timestamps in InsightFinder millisecond format for query compatibility.
     """
     tz_name = await _fetch_owner_timezone_from_api()
-    tz = _make_tz(tz_name)
+    return _build_current_datetime(tz_name, int(time.time()))
 
-    now_local = datetime.now(tz)
+
+@functools.lru_cache(maxsize=64)
+def _build_current_datetime(tz_name: str, epoch_s: int) -> str:
+    """Build the get_current_datetime payload; cached so calls within the same second reuse it."""
+    now_local = datetime.fromtimestamp(epoch_s, _make_tz(tz_name))
     current_time_ms = _wall_clock_to_fake_utc_ms(now_local)
+    date_only, time_only = now_local.strftime("%Y-%m-%d %H:%M:%S").split(" ")
+    owner_time = f"{date_only} {time_only} ({tz_name})"
 
     result = {
         "owner_timezone": tz_name,
-        "current_owner_time": now_local.strftime("%Y-%m-%d %H:%M:%S") + f" ({tz_name})",
+        "current_owner_time": owner_time,
         "current_time_milliseconds": current_time_ms,
         "formatted_time": {
-            "human_readable": now_local.strftime("%Y-%m-%d %H:%M:%S") + f" ({tz_name})",
-            "date_only": now_local.strftime("%Y-%m-%d"),
-            "time_only": now_local.strftime("%H:%M:%S"),
+            "human_readable": owner_time,
+            "date_only": date_only,
+            "time_only": time_only,
         },
+        # Aware datetime subtraction is wall-clock arithmetic, so offsets can be
+        # applied directly to the fake-UTC milliseconds.
         "relative_times_milliseconds": {
-            "1_hour_ago": _wall_clock_to_fake_utc_ms(now_local - timedelta(hours=1)),
-            "6_hours_ago": _wall_clock_to_fake_utc_ms(now_local - timedelta(hours=6)),
-            "12_hours_ago": _wall_clock_to_fake_utc_ms(now_local - timedelta(hours=12)),
-            "24_hours_ago": _wall_clock_to_fake_utc_ms(now_local - timedelta(hours=24)),
-            "1_week_ago": _wall_clock_to_fake_utc_ms(now_local - timedelta(days=7)),
-            "1_month_ago": _wall_clock_to_fake_utc_ms(now_local - timedelta(days=30)),
+            "1_hour_ago": current_time_ms - 3_600_000,
+            "6_hours_ago": current_time_ms - 6 * 3_600_000,
+            "12_hours_ago": current_time_ms - 12 * 3_600_000,
+            "24_hours_ago": current_time_ms - _DAY_MS,
+            "1_week_ago": current_time_ms - 7 * _DAY_MS,
+            "1_month_ago": current_time_ms - 30 * _DAY_MS,
         },
     }
 
@@ -596,8 +669,8 @@ def parse_datetime_string_to_ms(timestamp_str: str) -> int:
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=timezone.utc)
     
-    # Convert to UTC if not already
-    dt_utc = dt.astimezone(timezone.utc)
+    # Convert to UTC if not already ('Z', '+00:00' and naive input already are)
+    dt_utc = dt if dt.tzinfo is timezone.utc else dt.astimezone(timezone.utc)
     
     # Convert to milliseconds timestamp
     timestamp_ms = int(dt_utc.timestamp() * 1000)
@@ -641,24 +714,27 @@ async def get_time_range(hours_back: int = 24) -> str:
         hours_back: Number of hours to go back from current time (default: 24)
     """
     tz_name = await _fetch_owner_timezone_from_api()
-    tz = _make_tz(tz_name)
+    return _build_time_range(tz_name, hours_back, int(time.time()))
 
-    now_local = datetime.now(tz)
-    start_local = now_local - timedelta(hours=hours_back)
+
+@functools.lru_cache(maxsize=64)
+def _build_time_range(tz_name: str, hours_back: int, epoch_s: int) -> str:
+    """Build the get_time_range payload; cached so calls within the same second reuse it."""
+    now_local = datetime.fromtimestamp(epoch_s, _make_tz(tz_name))
 
     end_ms = _wall_clock_to_fake_utc_ms(now_local)
-    start_ms = _wall_clock_to_fake_utc_ms(start_local)
+    start_ms = end_ms - hours_back * 3_600_000
 
     result = {
         "owner_timezone": tz_name,
         "query_period_hours": hours_back,
         "end_time": {
             "milliseconds": end_ms,
-            "owner_time": now_local.strftime("%Y-%m-%d %H:%M:%S") + f" ({tz_name})",
+            "owner_time": format_timestamp_for_display(end_ms, tz_name),
         },
         "start_time": {
             "milliseconds": start_ms,
-            "owner_time": start_local.strftime("%Y-%m-%d %H:%M:%S") + f" ({tz_name})",
+            "owner_time": format_timestamp_for_display(start_ms, tz_name),
         },
     }
 
@@ -867,6 +943,16 @@ def parse_relative_date_keyword(keyword: str, tz_name: str) -> Tuple[Optional[in
 
     tz = _make_tz(tz_name)
     now_local = datetime.now(tz)
+
+    # Whole-day keywords only need the fake-UTC midnight, which is plain
+    # integer arithmetic on the epoch (end of day is 23:59:59, as below).
+    if keyword_lower in ("today", "yesterday"):
+        now_ms = _wall_clock_to_fake_utc_ms(now_local)
+        start_ms = now_ms - now_ms % _DAY_MS
+        if keyword_lower == "yesterday":
+            start_ms -= _DAY_MS
+        return start_ms, start_ms + _DAY_MS - 1000
+
     today = now_local.date()
 
     # Calculate Monday of this week (0 = Monday, 6 = Sunday)
@@ -1,8 +1,22 @@
 import sys
+import json
+import math
+import time
+import functools
+import heapq
+import asyncio
 import logging
-from typing import Dict, Any, Optional, List
+from collections import Counter, OrderedDict
+from operator import itemgetter
+from typing import Callable, Dict, Any, Iterable, Iterator, Optional, List, Tuple
 from datetime import datetime, timezone, timedelta
 
+try:
+    # Faster parser for the RCA sourceDetail payloads
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 from ..server import mcp_server
 from ...api_client.client_factory import get_current_api_client
@@ -12,11 +26,73 @@ from .get_time import (
     resolve_system_timezone,
     format_timestamp_in_user_timezone,
     format_api_timestamp_corrected,
+    format_timestamp_for_display,
     convert_to_ms,
     parse_time_parameters,
     parse_relative_date_keyword,
 )
 
+# Debug output is configured once via the environment; read the flag at import
+# instead of going through the settings object on every tool call.
+_DEBUG_ENABLED = bool(getattr(settings, "ENABLE_DEBUG_MESSAGES", False))
+
+# Timestamps are "fake UTC" (owner wall-clock encoded as UTC), so day
+# boundaries are plain multiples of this.
+_DAY_MS = 86_400_000
+
+# Short-lived cache of get_incidents responses so a drill-down (overview ->
+# list -> summary -> statistics, project and consolidated views) over the
+# same window reuses one fetch. Keyed by client
+# identity as well, since API clients are per-request. Cached responses are
+# shared between calls and must not be mutated. Lock entries are
+# [lock, number of callers using it] and are dropped when the count hits 0.
+_INCIDENTS_CACHE_TTL_S = 30
+_INCIDENTS_CACHE_MAX = 64
+_INCIDENTS_CACHE: "OrderedDict[tuple, tuple]" = OrderedDict()
+_INCIDENTS_LOCKS: Dict[tuple, list] = {}
+
+# Merged RCA chains for get_incident_details, keyed by client identity, owner
+# timezone and rootCauseInfoKey, so paging through batches reuses one fetch.
+_RCA_CHAIN_CACHE_TTL_S = 300
+_RCA_CHAIN_CACHE_MAX = 32
+_RCA_CHAIN_CACHE: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+# RCA chain events returned per get_incident_details call by default
+_RCA_BATCH_SIZE = 10
+
+# Upper bound on concurrent recommendation requests from predict_incidents
+_RECOMMENDATION_CONCURRENCY = 8
+
+# Results with at least this many timeline rows are aggregated in a worker
+# thread so the event loop keeps serving other tool calls meanwhile.
+_OFFLOAD_MIN_ROWS = 500
+
+# Consolidation type reported when an item carries no dampeningFlagInfo.flagDesc
+_DEFAULT_FLAG_DESC = "Instance level content similarity consolidation"
+
+# The single-incident tools (details, raw data) look the incident up in this
+# window either side of its timestamp; sharing it lets the incidents cache
+# serve the whole drill-down
+_INCIDENT_LOOKUP_WINDOW_MS = 60_000
+
+_NO_API_CLIENT_MESSAGE = (
+    "InsightFinder API client not available. "
+    "This tool requires InsightFinder credentials in HTTP headers: "
+    "X-InsightFinder-License-Key and X-InsightFinder-User-Name"
+)
+
+# Fields lifted from an RCA node's sourceDetail content into key_fields
+_RCA_COMMON_FIELDS = ("_id", "cdn", "id", "status_code", "status_text", "url", "name", "product", "location", "time")
+
+# Sentinel for single-lookup .get() probes where None is a valid value
+_MISSING = object()
+
+
+# format_timestamp_in_user_timezone and format_api_timestamp_corrected both
+# delegate to the memoized format_timestamp_for_display; the row loops call
+# it directly to skip the wrapper frame.
+_fmt_user = _fmt_api = format_timestamp_for_display
+
 
 # Layer 0: Ultra-compact incident overview (just counts and basic info)
 @mcp_server.tool()
@@ -72,126 +148,32 @@ async def get_incidents_overview(
         return {"status": "error", "message": "Invalid system_name"}
     
     try:
-        # Resolve owner timezone for this system
-        tz_name, system_name = await resolve_system_timezone(system_name)
-
-        # Parse time parameters (supports both keywords and absolute dates)
+        api_client = _get_api_client()
+        # Resolve owner timezone and the query window for this system
         try:
-            start_time_ms, end_time_ms = parse_time_parameters(start_time, end_time, tz_name)
+            tz_name, system_name, start_time_ms, end_time_ms = await _resolve_time_window(
+                system_name, start_time, end_time
+            )
         except ValueError as e:
             return {"status": "error", "message": str(e)}
-        
-        # Set default time range if not provided (timezone-aware)
-        if end_time_ms is None or start_time_ms is None:
-            default_start_ms, default_end_ms = get_time_range_ms(tz_name, 1)
-            if end_time_ms is None:
-                end_time_ms = default_end_ms
-            if start_time_ms is None:
-                start_time_ms = default_start_ms
-        # print(f"[DEBUG] Using time range: {start_time_ms} to {end_time_ms}", file=sys.stderr)
-
-        
-        # If start and end time are the same (e.g. user provided "2026-02-12" for both),
-        # expand to cover the full day (00:00:00.000 to 23:59:59.999).
-        # We treat the timestamp as UTC because it's already "fake UTC" (owner wall-clock).
-        if start_time_ms is not None and end_time_ms is not None and start_time_ms == end_time_ms:
-            import datetime
-            dt = datetime.datetime.fromtimestamp(start_time_ms / 1000, tz=datetime.timezone.utc)
-            # Set to start of day
-            start_dt = dt.replace(hour=0, minute=0, second=0, microsecond=0)
-            # Set to end of day
-            end_dt = dt.replace(hour=23, minute=59, second=59, microsecond=999000)
-            
-            start_time_ms = int(start_dt.timestamp() * 1000)
-            end_time_ms = int(end_dt.timestamp() * 1000)
-            
-            if settings.ENABLE_DEBUG_MESSAGES:
-                logger.debug(f"Expanded equal start/end time to full day: {start_time_ms} - {end_time_ms}")
 
         # Call the InsightFinder API client
-        api_client = _get_api_client()
-        result = await api_client.get_incidents(
-            system_name=system_name,
-            start_time_ms=start_time_ms,
-            end_time_ms=end_time_ms,
-        )
+        result = await _cached_get_incidents(api_client, system_name, start_time_ms, end_time_ms)
 
-        if settings.ENABLE_DEBUG_MESSAGES:
+        if _DEBUG_ENABLED:
             logger.debug("Overview query - tz=%s, range=%s to %s", tz_name, start_time_ms, end_time_ms)
 
         if result["status"] != "success":
             return result
 
-        incidents = result["data"]
-        consolidated_data = result.get("consolidated_data", [])
-        consolidated_index = _build_consolidated_index(consolidated_data)
-
-        # Filter by project name if specified
-        if project_name:
-            incidents = [i for i in incidents if i.get("projectName", "").lower() == project_name.lower() or i.get("projectDisplayName", "").lower() == project_name.lower()]
-
-        # primary_count is the number of primary incident objects; total uses count fields
-        primary_count = len(incidents)
-        consolidated_count = sum(c.get("count", 0) for c in consolidated_data)
-        total_incidents = sum(i.get("count", 0) for i in incidents) + consolidated_count
-
-        # Time range analysis (primaries only for first/last timestamps)
-        if incidents:
-            timestamps = [incident["timestamp"] for incident in incidents]
-            first_incident = min(timestamps)
-            last_incident = max(timestamps)
-        else:
-            first_incident = last_incident = None
-
-        # Unique dimension counts across primary incidents
-        unique_components = len(set(incident.get("componentName", "Unknown") for incident in incidents))
-        unique_instances = len(set(incident.get("instanceName", "Unknown") for incident in incidents))
-        unique_patterns = len(set(incident.get("patternName", "Unknown") for incident in incidents))
-        unique_projects = len(set(incident.get("projectDisplayName", "Unknown") for incident in incidents))
-
-        summary = {
-            "total_incidents": total_incidents,
-            "consolidated_incidents": primary_count,
-            "suppressed_incidents": total_incidents - primary_count,
-            "primaries_with_consolidation": sum(1 for i in incidents if i.get("relatedTimelineIdList")),
-            "unique_components": unique_components,
-            "unique_instances": unique_instances,
-            "unique_patterns": unique_patterns,
-            "unique_projects": unique_projects,
-            "first_event": format_api_timestamp_corrected(first_incident, tz_name) if first_incident else None,
-            "last_event": format_api_timestamp_corrected(last_incident, tz_name) if last_incident else None,
-            "has_incidents": total_incidents > 0
-        }
-
-        if include_consolidated:
-            # Tally flagDesc across all items in both timelineList and consolidatedTimelineList
-            flag_counts: Dict[str, int] = {}
-            for item in incidents:
-                flag_desc = (item.get("dampeningFlagInfo") or {}).get("flagDesc", "") or "Instance level content similarity consolidation"
-                flag_counts[flag_desc] = flag_counts.get(flag_desc, 0) + 1
-            for item in consolidated_data:
-                flag_desc = (item.get("dampeningFlagInfo") or {}).get("flagDesc", "") or "Instance level content similarity consolidation"
-                flag_counts[flag_desc] = flag_counts.get(flag_desc, 0) + 1
-            # Remaining = total_incidents - total object count; represents count-field excess with no known type
-            excess = total_incidents - (len(incidents) + len(consolidated_data))
-            if excess > 0:
-                flag_counts["Instance level content similarity consolidation"] = flag_counts.get("Instance level content similarity consolidation", 0) + excess
-            summary["consolidation_breakdown"] = flag_counts
-
-        return {
-            "status": "success",
-            "system_name": system_name,
-            "timezone": tz_name,
-            "time_range": {
-                "start_human": format_timestamp_in_user_timezone(start_time_ms, tz_name),
-                "end_human": format_timestamp_in_user_timezone(end_time_ms, tz_name)
-            },
-            "summary": summary
-        }
+        return await _build_off_loop(
+            _build_overview,
+            result, system_name, tz_name, start_time_ms, end_time_ms, project_name, include_consolidated,
+        )
 
     except Exception as e:
         error_message = f"Error in get_incidents_overview: {str(e)}"
-        if settings.ENABLE_DEBUG_MESSAGES:
+        if _DEBUG_ENABLED:
             print(error_message, file=sys.stderr)
         return {"status": "error", "message": error_message}
 
@@ -203,7 +185,8 @@ async def get_incidents_list(
     end_time: Optional[str] = None,
     limit: int = 10,
     only_true_incidents: bool = True,
-    include_consolidated: bool = False
+    include_consolidated: bool = False,
+    include_human_timestamps: bool = True
 ) -> Dict[str, Any]:
     """
     Fetches a compact list of incidents with basic information only.
@@ -228,125 +211,36 @@ async def get_incidents_list(
         only_true_incidents (bool): If True, only return events marked as true incidents. default is True.
         include_consolidated (bool): If True, each incident will include a list of consolidated
             (dampened/suppressed) incidents that were grouped under it. Default is False.
+        include_human_timestamps (bool): If False, incidents carry only the millisecond
+            "timestamp" and no "timestamp_human" string. Default is True.
 
     Note: All timestamps are in the Owner User Timezone. Display times using the
     "timezone" field from the response, never label as UTC.
     """
     try:
-        # Resolve owner timezone for this system
-        tz_name, system_name = await resolve_system_timezone(system_name)
-
-        # Convert string timestamps to integers if needed
+        api_client = _get_api_client()
+        # Resolve owner timezone and the query window for this system
         try:
-            start_time_ms, end_time_ms = parse_time_parameters(start_time, end_time, tz_name)
+            tz_name, system_name, start_time_ms, end_time_ms = await _resolve_time_window(
+                system_name, start_time, end_time
+            )
         except ValueError as e:
             return {"status": "error", "message": str(e)}
-        
-        # Set default time range if not provided (timezone-aware)
-        if end_time_ms is None or start_time_ms is None:
-            default_start_ms, default_end_ms = get_time_range_ms(tz_name, 1)
-            if end_time_ms is None:
-                end_time_ms = default_end_ms
-            if start_time_ms is None:
-                start_time_ms = default_start_ms
-
-
-
-        # If start and end time are the same (e.g. user provided "2026-02-12" for both),
-        # expand to cover the full day (00:00:00.000 to 23:59:59.999).
-        if start_time_ms is not None and end_time_ms is not None and start_time_ms == end_time_ms:
-            import datetime
-            dt = datetime.datetime.fromtimestamp(start_time_ms / 1000, tz=datetime.timezone.utc)
-            start_dt = dt.replace(hour=0, minute=0, second=0, microsecond=0)
-            end_dt = dt.replace(hour=23, minute=59, second=59, microsecond=999000)
-            
-            start_time_ms = int(start_dt.timestamp() * 1000)
-            end_time_ms = int(end_dt.timestamp() * 1000)
-            
-            if settings.ENABLE_DEBUG_MESSAGES:
-                logger.debug(f"Expanded equal start/end time to full day: {start_time_ms} - {end_time_ms}")
 
         # Call the InsightFinder API client
-        api_client = _get_api_client()
-        result = await api_client.get_incidents(
-            system_name=system_name,
-            start_time_ms=start_time_ms,
-            end_time_ms=end_time_ms,
-        )
+        result = await _cached_get_incidents(api_client, system_name, start_time_ms, end_time_ms)
 
         if result["status"] != "success":
             return result
 
-        incidents = result["data"]
-        consolidated_data = result.get("consolidated_data", [])
-        consolidated_index = _build_consolidated_index(consolidated_data)
-
-        # Filter for true incidents if requested
-        if only_true_incidents:
-            incidents = [i for i in incidents if i.get("isIncident", False)]
-
-        # Sort by timestamp (most recent first) and limit
-        incidents = sorted(incidents, key=lambda x: x["timestamp"], reverse=True)[:limit]
-
-        # Create compact incident list
-        incident_list = []
-        for i, incident in enumerate(incidents):
-            incident_info = {
-                "id": i + 1,
-                "timestamp": incident["timestamp"],
-                "timestamp_human": format_api_timestamp_corrected(incident["timestamp"], tz_name),
-                "projectDisplayName": incident.get("projectDisplayName", "Unknown"),
-                "realProjectName": incident.get("projectName", "Unknown"),
-                "component": incident.get("componentName", "Unknown"),
-                "instance": incident.get("instanceName", "Unknown"),
-            }
-
-            # Add metric name right after instance only if available
-            if "rootCause" in incident and incident["rootCause"] and "metricName" in incident["rootCause"]:
-                incident_info["metricName"] = incident["rootCause"]["metricName"]
-
-            # Add remaining fields
-            incident_info.update({
-                "pattern": incident.get("patternName", "Unknown"),
-                "anomaly_score": round(incident.get("anomalyScore", 0), 2),
-                "is_incident": incident.get("isIncident", False),
-                "status": incident.get("status", "unknown")
-            })
-
-            snow = _extract_servicenow_info(incident)
-            if snow:
-                incident_info["servicenow_ticket"] = snow
-
-            if include_consolidated:
-                consolidated = _attach_consolidated(incident, consolidated_index, tz_name)
-                incident_info["consolidated_incidents"] = consolidated
-                incident_info["consolidated_count"] = len(consolidated)
-
-            incident_list.append(incident_info)
-
-        response = {
-            "status": "success",
-            "system_name": system_name,
-            "filters": {
-                "only_true_incidents": only_true_incidents,
-                "limit": limit,
-                "include_consolidated": include_consolidated
-            },
-            "time_range": {
-                "start_human": format_timestamp_in_user_timezone(start_time_ms, tz_name),
-                "end_human": format_timestamp_in_user_timezone(end_time_ms, tz_name)
-            },
-            "total_found": len(result["data"]),
-            "returned_count": len(incident_list),
-            "incidents": incident_list
-        }
-        if include_consolidated:
-            response["total_consolidated_found"] = len(consolidated_data)
-        return response
+        return _build_incidents_list(
+            result, system_name, tz_name, start_time_ms, end_time_ms,
+            limit, only_true_incidents, include_consolidated, include_human_timestamps,
+        )
 
     except Exception as e:
         error_message = f"Error in get_incidents_list: {str(e)}"
-        if settings.ENABLE_DEBUG_MESSAGES:
+        if _DEBUG_ENABLED:
             print(error_message, file=sys.stderr)
         return {"status": "error", "message": error_message}
 
@@ -359,7 +253,8 @@ async def get_incidents_summary(
     limit: int = 5,
     only_true_incidents: bool = True,
     include_root_cause_info: bool = True,
-    include_consolidated: bool = False
+    include_consolidated: bool = False,
+    include_human_timestamps: bool = True
 ) -> Dict[str, Any]:
     """
     Fetches a detailed summary of incidents including root cause information.
@@ -380,152 +275,42 @@ async def get_incidents_summary(
         include_root_cause_info (bool): If True, include information about root cause availability (default: True).
         include_consolidated (bool): If True, each incident will include a list of consolidated
             (dampened/suppressed) incidents grouped under it, with consolidation type and info. Default is False.
+        include_human_timestamps (bool): If False, incidents carry only the millisecond
+            "timestamp" and no "timestamp_human" string. Default is True.
+
+    To keep the payload small, descriptive incident fields are omitted when they are
+    missing or empty: an absent projectDisplayName, realProjectName, instanceName,
+    metricName, componentName or patternName means "Unknown", an absent status means
+    "unknown", an absent anomalyScore means 0 and an absent isIncident means False.
 
     Note: All timestamps are in the Owner User Timezone. Display times using the
     "timezone" field from the response, never label as UTC.
     """
     try:
-        # Resolve owner timezone for this system
-        tz_name, system_name = await resolve_system_timezone(system_name)
-
-        # Convert string timestamps to integers if needed
+        api_client = _get_api_client()
+        # Resolve owner timezone and the query window for this system
         try:
-            start_time_ms, end_time_ms = parse_time_parameters(start_time, end_time, tz_name)
+            tz_name, system_name, start_time_ms, end_time_ms = await _resolve_time_window(
+                system_name, start_time, end_time
+            )
         except ValueError as e:
             return {"status": "error", "message": str(e)}
-        
-        # Set default time range if not provided (timezone-aware)
-        if end_time_ms is None or start_time_ms is None:
-            default_start_ms, default_end_ms = get_time_range_ms(tz_name, 1)
-            if end_time_ms is None:
-                end_time_ms = default_end_ms
-            if start_time_ms is None:
-                start_time_ms = default_start_ms
-
-
-
-        # If start and end time are the same (e.g. user provided "2026-02-12" for both),
-        # expand to cover the full day (00:00:00.000 to 23:59:59.999).
-        if start_time_ms is not None and end_time_ms is not None and start_time_ms == end_time_ms:
-            import datetime
-            dt = datetime.datetime.fromtimestamp(start_time_ms / 1000, tz=datetime.timezone.utc)
-            start_dt = dt.replace(hour=0, minute=0, second=0, microsecond=0)
-            end_dt = dt.replace(hour=23, minute=59, second=59, microsecond=999000)
-            
-            start_time_ms = int(start_dt.timestamp() * 1000)
-            end_time_ms = int(end_dt.timestamp() * 1000)
-            
-            if settings.ENABLE_DEBUG_MESSAGES:
-                logger.debug(f"Expanded equal start/end time to full day: {start_time_ms} - {end_time_ms}")
 
         # Call the InsightFinder API client
-        api_client = _get_api_client()
-        result = await api_client.get_incidents(
-            system_name=system_name,
-            start_time_ms=start_time_ms,
-            end_time_ms=end_time_ms,
-        )
+        result = await _cached_get_incidents(api_client, system_name, start_time_ms, end_time_ms)
 
         if result["status"] != "success":
             return result
 
-        incidents = result["data"]
-        consolidated_data = result.get("consolidated_data", [])
-        consolidated_index = _build_consolidated_index(consolidated_data)
-
-        # Filter for true incidents if requested
-        if only_true_incidents:
-            incidents = [i for i in incidents if i.get("isIncident", False)]
-
-        # Sort by timestamp (most recent first) and limit
-        incidents = sorted(incidents, key=lambda x: x["timestamp"], reverse=True)[:limit]
-
-        # Extract detailed summary information
-        incidents_summary = []
-        for incident in incidents:
-            timestamp_str = format_api_timestamp_corrected(incident["timestamp"], tz_name)
-
-            summary = {
-                "incident_id": len(incidents_summary) + 1,
-                "timestamp": incident["timestamp"],
-                "timestamp_human": timestamp_str,
-                "projectDisplayName": incident.get("projectDisplayName", "Unknown"),
-                "realProjectName": incident.get("projectName", "Unknown"),
-                "instanceName": incident.get("instanceName", "Unknown"),
-            }
-
-            # Add metric name right after instanceName only if available
-            if "rootCause" in incident and incident["rootCause"] and "metricName" in incident["rootCause"]:
-                summary["metricName"] = incident["rootCause"]["metricName"]
-
-            # Add remaining fields
-            summary.update({
-                "componentName": incident.get("componentName", "Unknown"),
-                "patternName": incident.get("patternName", "Unknown"),
-                "anomalyScore": incident.get("anomalyScore", 0),
-                "status": incident.get("status", "unknown"),
-                "isIncident": incident.get("isIncident", False),
-                "has_raw_data": "rawData" in incident and incident["rawData"] is not None,
-                "has_root_cause": incident.get('rootCauseResultInfo', {}).get('hasPrecedingEvent', False) or ("rootCause" in incident and incident["rootCause"] is not None),
-            })
-
-            # Add root cause information if available
-            if include_root_cause_info:
-                root_cause_info = {}
-
-                if "rootCauseResultInfo" in incident and incident["rootCauseResultInfo"]:
-                    root_cause_info["result_info"] = {
-                        "hasPrecedingEvent": incident["rootCauseResultInfo"].get("hasPrecedingEvent", False),
-                        "hasTrailingEvent": incident["rootCauseResultInfo"].get("hasTrailingEvent", False),
-                        "causedByChangeEvent": incident["rootCauseResultInfo"].get("causedByChangeEvent", False),
-                    }
-
-                if "rootCauseInfoKey" in incident and incident["rootCauseInfoKey"]:
-                    root_cause_info["info_key"] = {
-                        "projectName": incident["rootCauseInfoKey"].get("projectName"),
-                        "instanceName": incident["rootCauseInfoKey"].get("instanceName"),
-                        "incidentTimestamp": incident["rootCauseInfoKey"].get("incidentTimestamp")
-                    }
-
-                if root_cause_info:
-                    summary["root_cause_info"] = root_cause_info
-
-            snow = _extract_servicenow_info(incident)
-            if snow:
-                summary["servicenow_ticket"] = snow
-
-            if include_consolidated:
-                consolidated = _attach_consolidated(incident, consolidated_index, tz_name)
-                summary["consolidated_incidents"] = consolidated
-                summary["consolidated_count"] = len(consolidated)
-
-            incidents_summary.append(summary)
-
-        response = {
-            "status": "success",
-            "system_name": system_name,
-            "filters": {
-                "only_true_incidents": only_true_incidents,
-                "limit": limit,
-                "include_consolidated": include_consolidated
-            },
-            "time_range": {
-                "start": start_time_ms,
-                "end": end_time_ms,
-                "start_human": format_timestamp_in_user_timezone(start_time_ms, tz_name),
-                "end_human": format_timestamp_in_user_timezone(end_time_ms, tz_name)
-            },
-            "total_found": len(result["data"]),
-            "returned_count": len(incidents_summary),
-            "incidents": incidents_summary
-        }
-        if include_consolidated:
-            response["total_consolidated_found"] = len(consolidated_data)
-        return response
+        return _build_incidents_summary(
+            result, system_name, tz_name, start_time_ms, end_time_ms,
+            limit, only_true_incidents, include_root_cause_info, include_consolidated,
+            include_human_timestamps,
+        )
 
     except Exception as e:
         error_message = f"Error in get_incidents_summary: {str(e)}"
-        if settings.ENABLE_DEBUG_MESSAGES:
+        if _DEBUG_ENABLED:
             print(error_message, file=sys.stderr)
         return {"status": "error", "message": error_message}
 
@@ -539,7 +324,9 @@ async def get_incident_details(
     pattern_name: Optional[str] = None,
     include_root_cause: bool = True,
     fetch_rca_chain: bool = False,
-    include_recommendations: bool = False
+    include_recommendations: bool = False,
+    rca_batch_offset: int = 0,
+    rca_batch_size: int = _RCA_BATCH_SIZE
 ) -> Dict[str, Any]:
     """
     Fetches complete information about a specific incident, excluding raw data to keep response manageable.
@@ -548,12 +335,15 @@ async def get_incident_details(
     ⚠️ YEAR DEFAULT: If the user provides only a month and day (e.g., "May 16", "March 5") without a year, always default to year 2026.
 
     Note - Important Policy:
-    - Always fetch and display the **entire root cause analysis (RCA) chain**.  
+    - Always fetch the root cause analysis (RCA) chain; it is returned **one batch per call** (see below), and no event may be skipped when paging through it.  
     - The RCA chain must include **all available timestamps, project names, event details, and CDN (if available)**.  
     - The RCA chain must be displayed in **strict chronological order by event timestamp**, with no reordering or omission.  
     - RCA events should be displayed in **batches of 7-10 at a time**, always in order.  
     - After showing a batch, clearly indicate the **total RCA event count**, how many have been shown, and how many remain.  
     - Prompt the user if they want to see the remaining events.  
+    - The structured RCA chain is returned one batch at a time: `root_cause_chain_event_count` is the
+      total and `rca_batch` gives the offset, returned count and remaining count. To show the next
+      batch, call again with `rca_batch_offset` set to the previous offset plus the returned count.
 
     Recommendations:
     - If the user requests recommendations, set `include_recommendations=True`.  
@@ -571,268 +361,113 @@ async def get_incident_details(
         include_root_cause (bool): Whether to include detailed root cause information.
         fetch_rca_chain (bool): Whether to fetch the full root cause analysis chain (always set to True when user requests root cause or causal chain).
         include_recommendations (bool): Whether to include recommendations or remediation steps if available.
+        rca_batch_offset (int): Index of the first RCA chain event to return (default: 0).
+        rca_batch_size (int): Number of RCA chain events to return (default: 10; 0 or less returns all remaining).
     """
     try:
-        # Resolve owner timezone for this system
-        tz_name, system_name = await resolve_system_timezone(system_name)
-
-        # Convert any human-readable timestamp to InsightFinder fake-UTC ms
-        try:
-            timestamp_ms = convert_to_ms(incident_timestamp, "incident_timestamp", tz_name)
-        except ValueError as e:
-            return {"status": "error", "message": str(e)}
-
-        if timestamp_ms is None:
-            return {"status": "error", "message": "incident_timestamp is required"}
-        
-        # Use a 1-minute window around the incident timestamp
-        window_ms = 1 * 60 * 1000  # 1 minute in milliseconds
-        start_time = timestamp_ms - window_ms
-        end_time = timestamp_ms + window_ms
-        
         client = _get_api_client()
-        incidents_response = await client._fetch_timeline_data(
-            "incident",
-            system_name,
-            start_time,
-            end_time
+        found, lookup = await _fetch_one_incident(
+            client, system_name, incident_timestamp, instance_name, pattern_id, pattern_name
         )
+        if not found:
+            return lookup
 
-        # Find the specific incident in the response
-        incidents = incidents_response.get('data', [])
-        
-        # Filter only true incidents
-        incidents = [i for i in incidents if i.get('isIncident', False)]
-        
-        incident_data = None
-        
-        # Check if all optional filters are None
-        if instance_name is None and pattern_id is None and pattern_name is None:
-            # Timestamp match at minute granularity (ignoring seconds and milliseconds)
-            target_timestamp_minutes = timestamp_ms // 60000  # Convert to minutes
-            for inc in incidents:
-                incident_timestamp_minutes = inc.get('timestamp', 0) // 60000  # Convert to minutes
-                if incident_timestamp_minutes == target_timestamp_minutes:
-                    incident_data = inc
-                    break
-        else:
-            # Filter by optional parameters within time window
-            for inc in incidents:
-                if inc.get('timestamp') >= start_time and inc.get('timestamp') <= end_time:
-                    # Check all provided filters
-                    match = True
-                    
-                    if instance_name is not None and inc.get('instanceName') != instance_name:
-                        match = False
-                    
-                    if pattern_id is not None and inc.get('patternId') != pattern_id:
-                        match = False
-                    
-                    if pattern_name is not None and inc.get('patternName') != pattern_name:
-                        match = False
-                    
-                    if match:
-                        incident_data = inc
-                        break
-            
-            # If no match found with filters, return the first incident in the time window
-            if incident_data is None and incidents:
-                incident_data = incidents[0]
-                
-        if not incident_data:
-            return {"status": "error", "message": "No incident found with the specified timestamp"}
-
-        result_incident = incident_data.copy()  # For clarity in the result structure
-        result_incident.pop('rawData', None)  # Remove raw data to keep response manageable
-        result_incident.pop('rootCause', None)  # Remove root cause summary to avoid confusion
-        result_incident.pop('rootCauseResultInfo', None)  # Remove root cause result info to avoid confusion
-        result_incident.pop('rootCauseInfoKey', None)  # Remove root cause info key to avoid confusion
-        result_incident.pop('incidentLLMKey', None)  # Remove incidentLLMKey to avoid confusion
-
-        # Extract metric name if available in rootCause
-        metric_name = None
-        if "rootCause" in incident_data and incident_data["rootCause"] and "metricName" in incident_data["rootCause"]:
-            metric_name = incident_data["rootCause"]["metricName"]
-
-        snow = _extract_servicenow_info(incident_data)
-        result = {
-            "metricName": metric_name,
-            "incident": result_incident,
-            "raw_data_available": True,  # Indicate that raw data can be fetched separately
-            "root_cause_available": False,
-            "root_cause_chain": None,
-            "recommendation_available": False,
-            "recommendation": None,
-            "anomalyScore": incident_data.get("anomalyScore"),
-            "status": incident_data.get("status"),
-            "isIncident": incident_data.get("isIncident"),
-            "active": incident_data.get("active"),
-            "projectDisplayName": incident_data.get("projectDisplayName", "Unknown"),
-            "realProjectName": incident_data.get("projectName", "Unknown"),
-            "servicenow_ticket": snow
-        }
-
-        # Check if root cause analysis is available and requested
-        root_cause_info = incident_data.get('rootCauseInfoKey')
-        if include_root_cause and fetch_rca_chain:
-            # Try the LLM summary API first
-            llm_summary = None
-            incident_llm_key = incident_data.get('incidentLLMKey')
-            # get timestamp from rootCauseInfoKey.incidentTimestamp if available, otherwise use incident timestamp
-            llm_root_cause_timestamp = root_cause_info.get('incidentTimestamp') if root_cause_info and 'incidentTimestamp' in root_cause_info else incident_data.get('timestamp')
-            if incident_llm_key:
-                try:
-                    project_info = await client.get_customer_name_for_project(
-                        incident_llm_key.get('projectName', '')
-                    )
-                    system_id = project_info[4] if project_info else ''
-                    if system_id:
-                        llm_summary = await client.fetch_incident_llm_summary(
-                            user_name=incident_llm_key.get('userName', ''),
-                            project_name=incident_llm_key.get('projectName', ''),
-                            instance_name=incident_llm_key.get('instanceName', ''),
-                            timestamp=llm_root_cause_timestamp,
-                            pattern_id=incident_llm_key.get('patternId', 0),
-                            system_name=system_id
-                        )
-                        # logger.debug(f"LLM summary fetch result: {str(llm_summary)}")
-                        logger.info(f"LLM summary fetch successful {llm_summary}")
-                except Exception as e:
-                    logger.warning(f"Failed to fetch incident LLM summary: {str(e)}")
-
-            if llm_summary:
-                logger.info("RCA source: LLM summary API")
-                result["root_cause_chain"] = llm_summary
-                result["root_cause_available"] = True
-                result["root_cause_chain_event_count"] = 1
-            elif root_cause_info:
-                # Fallback: fetch the structured RCA chain
-                try:
-                    # print(f"[DEBUG] Fetching RCA chain for rootCauseInfoKey: {root_cause_info}", file=sys.stderr)
-                    rca_data = await client.fetch_root_cause_analysis(
-                        root_cause_info_key=root_cause_info,
-                        customer_name=incident_data.get('userName', '')
-                    )
-                    rca_chain = rca_data.get('rcaChainList', [])
-                    # Sort the RCA chain by the earliest eventTimestamp in each rcaNodeList
-                    def get_min_event_timestamp(chain_item):
-                        node_list = chain_item.get('rcaNodeList', [])
-                        timestamps = [node.get('eventTimestamp', float('inf')) for node in node_list if 'eventTimestamp' in node]
-                        return min(timestamps) if timestamps else float('inf')
-                    if isinstance(rca_chain, list) and rca_chain and 'rcaNodeList' in rca_chain[0]:
-                        rca_chain = sorted(rca_chain, key=get_min_event_timestamp)
-
-                    # Optionally, sort each rcaNodeList by eventTimestamp as well
-                    for chain_item in rca_chain:
-                        node_list = chain_item.get('rcaNodeList', [])
-                        if not (isinstance(node_list, list) and node_list and 'eventTimestamp' in node_list[0]):
-                            continue
-                        import json
-                        unique_nodes = {}
-                        for node in node_list:
-                            # Format didPredictionTime and eventEndTimestamp if present
-                            for ts_field in ('didPredictionTime', 'eventEndTimestamp', 'eventTimestamp'):
-                                if ts_field in node:
-                                    node[ts_field] = format_timestamp_in_user_timezone(node[ts_field], tz_name)
-
-                            # Replace sourceProjectName with sourceProjectDisplayName and remove the display name
-                            if 'sourceProjectDisplayName' in node:
-                                node['sourceProjectName'] = node['sourceProjectDisplayName']
-                                node.pop('sourceProjectDisplayName', None)
-
-                            # Parse and extract key fields from sourceDetail if present
-                            nid = node.get('nid')
-                            pattern_name = node.get('patternName')
-                            if 'sourceDetail' in node and node['sourceDetail']:
-                                import json
-                                try:
-                                    detail_obj = json.loads(node['sourceDetail'])
-                                    if detail_obj:
-                                        if detail_obj.get('nid'):
-                                            nid = detail_obj['nid']
-                                            node['nid'] = nid
-                                        if detail_obj.get('patternName'):
-                                            pattern_name = detail_obj['patternName']
-                                            node['patternName'] = pattern_name
-                                        if detail_obj.get('content'):
-                                            content_str = detail_obj['content']
-                                            import json as _json
-                                            try:
-                                                content = _json.loads(content_str) if isinstance(content_str, str) else content_str
-                                            except Exception:
-                                                content = content_str
-                                            # Extract common fields if they exist
-                                            common_fields = ["_id", "cdn", "id", "status_code", "status_text", "url", "name", "product", "location", "time"]
-                                            extracted_fields = {field: content[field] for field in common_fields if isinstance(content, dict) and field in content}
-                                            if extracted_fields:
-                                                node["key_fields"] = extracted_fields
-                                    node.pop('sourceDetail', None)  # Remove the original sourceDetail to reduce clutter
-                                except Exception:
-                                    pass
-                            # Build deduplication key
-                            key = (nid, pattern_name, node.get('sourceInstanceName'), node.get('sourceProjectName'))
-                            if key not in unique_nodes:
-                                # Copy node to avoid mutating original
-                                node_copy = dict(node)
-                                unique_nodes[key] = node_copy
-                        # Remove nid from each node to reduce clutter
-                        deduped_nodes = list(unique_nodes.values())
-                        # for n in deduped_nodes:
-                        #     n.pop('nid', None)
-                        chain_item['rcaNodeList'] = sorted(deduped_nodes, key=lambda n: n.get('eventTimestamp', 0))
-
-
-                    merged_nodes = merge_rca_chain(rca_chain)
-                    logger.info("RCA source: fallback structured chain (%d events)", len(merged_nodes))
-                    result["root_cause_chain"] = merged_nodes
-                    result["root_cause_chain_event_count"] = len(merged_nodes)
-                    result['root_cause_available'] = True
-                    # include the count of events in the chain
-                    # result['root_cause_chain_event_count'] = sum(len(item.get('rcaNodeList', [])) for item in rca_chain)
-                    # result['root_cause_chain'] = rca_chain
-                    # print(f"[DEBUG] RCA chain fetch result: {str(result['root_cause_chain'])}", file=sys.stderr)
-                    # print(f"[DEBUG] RCA chain event count: {result['root_cause_chain_event_count']}", file=sys.stderr)
-                except Exception as e:
-                    logger.warning(f"Failed to fetch root cause analysis: {str(e)}")
-        
-        # Check if root cause info is available in the incident data
-        if include_root_cause and incident_data.get('rootCauseResultInfo', {}).get('hasPrecedingEvent', False):
-            result['root_cause_available'] = True
-            if not result.get('root_cause_chain'):
-                result['root_cause_chain'] = []
-        
-        # Fetch recommendations if requested and incident LLM key is available
-        if include_recommendations and 'incidentLLMKey' in incident_data and incident_data['incidentLLMKey']:
-            # print(f"[DEBUG] Fetching recommendations for incidentLLMKey: {incident_data['incidentLLMKey']}")
-            try:
-                recommendation = await client.fetch_recommendation(
-                    incident_llm_key=incident_data['incidentLLMKey'],
-                    customer_name=incident_data.get('userName', '')
-                )
-                if recommendation:
-                    result['recommendation_available'] = True
-                    result['recommendation'] = recommendation
-                    # print(f"[DEBUG] Recommendation fetch result: {str(result['recommendation'])}", file=sys.stderr)
-            except Exception as e:
-                logger.warning(f"Failed to fetch recommendations: {str(e)}")
-
-        return result
+        return await _build_incident_details(
+            client, lookup["incident"], lookup["tz_name"],
+            include_root_cause, fetch_rca_chain, include_recommendations,
+            rca_batch_offset, rca_batch_size,
+        )
 
     except Exception as e:
         error_message = f"Error in get_incident_details: {str(e)}"
-        if settings.ENABLE_DEBUG_MESSAGES:
+        if _DEBUG_ENABLED:
             print(error_message, file=sys.stderr)
         return {"status": "error", "message": error_message}
 
-# Layer 4: Raw data extraction (for deep investigation)
 @mcp_server.tool()
-async def get_incident_raw_data(
+async def get_incident_full(
     system_name: str,
     incident_timestamp: str,
+    instance_name: Optional[str] = None,
+    pattern_id: Optional[str] = None,
+    pattern_name: Optional[str] = None,
+    include_root_cause: bool = True,
+    fetch_rca_chain: bool = False,
+    include_recommendations: bool = False,
     max_length: int = 5000
 ) -> Dict[str, Any]:
     """
-    Fetches the raw data (logs, stack traces) for a specific incident.
+    Fetches the details and the raw data of a specific incident in one call.
+    Use this instead of calling get_incident_details and then get_incident_raw_data for
+    the same incident; both parts are built from a single lookup of the incident.
+
+    ⚠️ YEAR DEFAULT: If the user provides only a month and day (e.g., "May 16", "March 5") without a year, always default to year 2026.
+
+    The same policy as get_incident_details applies to the RCA chain and recommendations in
+    the "details" entry; only the first RCA batch is returned, use get_incident_details with
+    `rca_batch_offset` for the following batches.
+
+    Args:
+        system_name (str): The name of the system to query.
+        incident_timestamp (str): The timestamp of the incident.
+                                  Accepts: "2026-02-12T01:15:00", or 13-digit milliseconds.
+        instance_name (str): Optional. Filter by specific instance name.
+        pattern_id (str): Optional. Filter by specific pattern ID.
+        pattern_name (str): Optional. Filter by specific pattern name.
+        include_root_cause (bool): Whether to include detailed root cause information.
+        fetch_rca_chain (bool): Whether to fetch the full root cause analysis chain.
+        include_recommendations (bool): Whether to include recommendations or remediation steps if available.
+        max_length (int): Maximum length of raw data to return (to prevent overwhelming the LLM).
+
+    Returns:
+        Dict with status, "details" (the get_incident_details response) and "raw_data"
+        (the get_incident_raw_data response) for the same incident, or the error
+        response when the incident can't be looked up.
+    """
+    # Security checks
+    if not system_name or len(system_name) > 100:
+        return {"status": "error", "message": "Invalid system_name"}
+
+    # Limit max_length to prevent abuse
+    max_length = min(max_length, 10000)
+
+    try:
+        client = _get_api_client()
+        # One lookup serves both parts, which describe the same incident row
+        found, lookup = await _fetch_one_incident(
+            client, system_name, incident_timestamp, instance_name, pattern_id, pattern_name
+        )
+        if not found:
+            return lookup
+
+        incident_data = lookup["incident"]
+        tz_name = lookup["tz_name"]
+        details = await _build_incident_details(
+            client, incident_data, tz_name,
+            include_root_cause, fetch_rca_chain, include_recommendations,
+            0, _RCA_BATCH_SIZE,
+        )
+        return {
+            "status": "success",
+            "details": details,
+            "raw_data": _build_incident_raw_data(incident_data, tz_name, max_length),
+        }
+
+    except Exception as e:
+        error_message = f"Error in get_incident_full: {str(e)}"
+        if _DEBUG_ENABLED:
+            print(error_message, file=sys.stderr)
+        return {"status": "error", "message": error_message}
+
+# Layer 4: Raw data extraction (for deep investigation)
+@mcp_server.tool()
+async def get_incident_raw_data(
+    system_name: str,
+    incident_timestamp: str,
+    max_length: int = 5000
+) -> Dict[str, Any]:
+    """
+    Fetches the raw data (logs, stack traces) for a specific incident.
     Use this only when you need to examine the actual error logs or stack traces.
 
     ⚠️ YEAR DEFAULT: If the user provides only a month and day (e.g., "May 16", "March 5") without a year, always default to year 2026.
@@ -851,75 +486,16 @@ async def get_incident_raw_data(
     max_length = min(max_length, 10000)
     
     try:
-        # Resolve owner timezone for this system
-        tz_name, system_name = await resolve_system_timezone(system_name)
-
-        # Convert any human-readable timestamp to InsightFinder fake-UTC ms
-        try:
-            timestamp_ms = convert_to_ms(incident_timestamp, "incident_timestamp", tz_name)
-        except ValueError as e:
-            return {"status": "error", "message": str(e)}
-
-        if timestamp_ms is None:
-            return {"status": "error", "message": "incident_timestamp is required"}
-        
-        # Get incidents for a small time window around the specific timestamp
-        start_time = timestamp_ms - (5 * 60 * 1000)  # 5 minutes before
-        end_time = timestamp_ms + (5 * 60 * 1000)    # 5 minutes after
-
         api_client = _get_api_client()
-        result = await api_client.get_incidents(
-            system_name=system_name,
-            start_time_ms=start_time,
-            end_time_ms=end_time,
-        )
-
-        if result["status"] != "success":
-            return result
-
-        # Find the specific incident
-        target_incident = None
-        for incident in result["data"]:
-            if incident["timestamp"] == timestamp_ms:
-                target_incident = incident
-                break
-
-        if not target_incident:
-            return {"status": "error", "message": f"Incident with timestamp {timestamp_ms} not found"}
+        found, lookup = await _fetch_one_incident(api_client, system_name, incident_timestamp, exact=True)
+        if not found:
+            return lookup
 
-        raw_data = target_incident.get("rawData", "")
-        if not raw_data:
-            return {"status": "error", "message": "No raw data available for this incident"}
+        return _build_incident_raw_data(lookup["incident"], lookup["tz_name"], max_length)
 
-        # Truncate if too long
-        if len(raw_data) > max_length:
-            raw_data = raw_data[:max_length] + f"\n... [TRUNCATED - Full length: {len(target_incident['rawData'])} characters]"
-
-        result = {
-            "status": "success",
-            "incident_timestamp": timestamp_ms,
-            "timestamp_human": format_api_timestamp_corrected(timestamp_ms, tz_name),
-            "projectName": target_incident.get("projectDisplayName"),
-            "instanceName": target_incident.get("instanceName"),
-        }
-        
-        # Add metric name right after instanceName only if available
-        if "rootCause" in target_incident and target_incident["rootCause"] and "metricName" in target_incident["rootCause"]:
-            result["metricName"] = target_incident["rootCause"]["metricName"]
-        
-        # Add remaining fields
-        result.update({
-            "componentName": target_incident.get("componentName"),
-            "raw_data": raw_data,
-            "raw_data_length": len(target_incident.get("rawData", "")),
-            "truncated": len(target_incident.get("rawData", "")) > max_length
-        })
-        
-        return result
-        
     except Exception as e:
         error_message = f"Error in get_incident_raw_data: {str(e)}"
-        if settings.ENABLE_DEBUG_MESSAGES:
+        if _DEBUG_ENABLED:
             print(error_message, file=sys.stderr)
         return {"status": "error", "message": error_message}
 
@@ -971,112 +547,122 @@ async def get_incidents_statistics(
         Statistical breakdown with top affected components, instances, patterns, and projects.
     """
     try:
-        # Resolve owner timezone for this system
-        tz_name, system_name = await resolve_system_timezone(system_name)
-
-        # Parse time parameters (supports both keywords and absolute dates)
+        api_client = _get_api_client()
+        # Resolve owner timezone and the query window for this system
         try:
-            start_time_ms, end_time_ms = parse_time_parameters(start_time, end_time, tz_name)
+            tz_name, system_name, start_time_ms, end_time_ms = await _resolve_query_window(
+                system_name, start_time, end_time
+            )
         except ValueError as e:
             return {"status": "error", "message": str(e)}
-        
-        # Set default time range if not provided (timezone-aware)
-        if end_time_ms is None or start_time_ms is None:
-            default_start_ms, default_end_ms = get_time_range_ms(tz_name, 1)
-            if end_time_ms is None:
-                end_time_ms = default_end_ms
-            if start_time_ms is None:
-                start_time_ms = default_start_ms
 
-        api_client = _get_api_client()
-        result = await api_client.get_incidents(
-            system_name=system_name,
-            start_time_ms=start_time_ms,
-            end_time_ms=end_time_ms,
-        )
+        result = await _cached_get_incidents(api_client, system_name, start_time_ms, end_time_ms)
 
         if result["status"] != "success":
             return result
 
-        incidents = result["data"]
-        consolidated_data = result.get("consolidated_data", [])
+        return await _build_off_loop(
+            _build_statistics,
+            result, system_name, tz_name, start_time_ms, end_time_ms, include_consolidated,
+        )
 
-        # primary_count is the number of primary incident objects; total uses count fields
-        primary_count = len(incidents)
-        referenced_consolidated_count = sum(c.get("count", 0) for c in consolidated_data)
-        total_incident_count = sum(i.get("count", 0) for i in incidents) + referenced_consolidated_count
-
-        components: Dict[str, int] = {}
-        instances: Dict[str, int] = {}
-        patterns: Dict[str, int] = {}
-        projects: Dict[str, int] = {}
-
-        for incident in incidents:
-            component = incident.get("componentName", "Unknown")
-            components[component] = components.get(component, 0) + 1
-            instance = incident.get("instanceName", "Unknown")
-            instances[instance] = instances.get(instance, 0) + 1
-            pattern = incident.get("patternName", "Unknown")
-            patterns[pattern] = patterns.get(pattern, 0) + 1
-            project = incident.get("projectDisplayName", "Unknown")
-            projects[project] = projects.get(project, 0) + 1
-
-        statistics: Dict[str, Any] = {
-            "total_incidents": total_incident_count,
-            "consolidated_incidents": primary_count,
-            "suppressed_incidents": total_incident_count - primary_count,
-            "top_affected_components": dict(sorted(components.items(), key=lambda x: x[1], reverse=True)[:10]),
-            "top_affected_instances": dict(sorted(instances.items(), key=lambda x: x[1], reverse=True)[:10]),
-            "top_patterns": dict(sorted(patterns.items(), key=lambda x: x[1], reverse=True)[:10]),
-            "top_affected_projects": dict(sorted(projects.items(), key=lambda x: x[1], reverse=True)[:10])
-        }
+    except Exception as e:
+        error_message = f"Error in get_incidents_statistics: {str(e)}"
+        if _DEBUG_ENABLED:
+            print(error_message, file=sys.stderr)
+        return {"status": "error", "message": error_message}
 
-        if include_consolidated:
-            c_components: Dict[str, int] = {}
-            c_instances: Dict[str, int] = {}
-            c_patterns: Dict[str, int] = {}
-            c_projects: Dict[str, int] = {}
-            flag_counts: Dict[str, int] = {}
-
-            # Tally flagDesc across all items in both timelineList and consolidatedTimelineList
-            for item in incidents:
-                flag_desc = (item.get("dampeningFlagInfo") or {}).get("flagDesc", "") or "Instance level content similarity consolidation"
-                flag_counts[flag_desc] = flag_counts.get(flag_desc, 0) + 1
-            for item in consolidated_data:
-                c_components[item.get("componentName", "Unknown")] = c_components.get(item.get("componentName", "Unknown"), 0) + 1
-                c_instances[item.get("instanceName", "Unknown")] = c_instances.get(item.get("instanceName", "Unknown"), 0) + 1
-                c_patterns[item.get("patternName", "Unknown")] = c_patterns.get(item.get("patternName", "Unknown"), 0) + 1
-                c_projects[item.get("projectDisplayName", "Unknown")] = c_projects.get(item.get("projectDisplayName", "Unknown"), 0) + 1
-                flag_desc = (item.get("dampeningFlagInfo") or {}).get("flagDesc", "") or "Instance level content similarity consolidation"
-                flag_counts[flag_desc] = flag_counts.get(flag_desc, 0) + 1
-            # Remaining = total_incidents - total object count; represents count-field excess with no known type
-            excess = total_incident_count - (len(incidents) + len(consolidated_data))
-            if excess > 0:
-                flag_counts["Instance level content similarity consolidation"] = flag_counts.get("Instance level content similarity consolidation", 0) + excess
-
-            statistics["consolidated_breakdown"] = {
-                "total_suppressed": referenced_consolidated_count,
-                "consolidation_type_breakdown": flag_counts,
-                "top_affected_components": dict(sorted(c_components.items(), key=lambda x: x[1], reverse=True)[:10]),
-                "top_affected_instances": dict(sorted(c_instances.items(), key=lambda x: x[1], reverse=True)[:10]),
-                "top_patterns": dict(sorted(c_patterns.items(), key=lambda x: x[1], reverse=True)[:10]),
-                "top_affected_projects": dict(sorted(c_projects.items(), key=lambda x: x[1], reverse=True)[:10])
+@mcp_server.tool()
+async def get_incidents_bundle(
+    system_name: str,
+    start_time: Optional[str] = None,
+    end_time: Optional[str] = None,
+    list_limit: int = 10,
+    summary_limit: int = 5,
+    only_true_incidents: bool = True,
+    include_consolidated: bool = False,
+    include_human_timestamps: bool = True
+) -> Dict[str, Any]:
+    """
+    Fetches the overview, compact list, summary and statistics of incidents in one call.
+    Use this instead of calling get_incidents_overview, get_incidents_list, get_incidents_summary
+    and get_incidents_statistics one after another for the same time window; all four views
+    are built from a single incident fetch.
+
+    ⚠️ YEAR DEFAULT: If the user provides only a month and day (e.g., "May 16", "March 5") without a year, always default to year 2026.
+
+    Args:
+        system_name (str): The name of the system to query for incidents.
+        start_time (Optional[Union[str, int]]): The start of the time window.
+            - Relative keywords: "thisweek", "lastweek", "thismonth", "lastmonth", "today", "yesterday"
+            - Absolute dates: "2026-02-12T11:05:00", "2026-02-12", "02/12/2026", or milliseconds
+        end_time (Optional[Union[str, int]]): The end of the time window.
+            - Relative keywords: "thisweek", "lastweek", "thismonth", "lastmonth", "today", "yesterday"
+            - Absolute dates: "2026-02-12T11:05:00", "2026-02-12", "02/12/2026", or milliseconds
+        list_limit (int): Maximum number of incidents in the compact list (default: 10).
+        summary_limit (int): Maximum number of incidents in the detailed summary (default: 5).
+        only_true_incidents (bool): If True, the list and summary only include events marked
+            as true incidents (default: True). The overview and statistics cover all events.
+        include_consolidated (bool): If True, include consolidated (dampened/suppressed)
+            incidents in every view, as the individual tools do. Default is False.
+        include_human_timestamps (bool): If False, list and summary incidents carry only the
+            millisecond "timestamp" and no "timestamp_human" string. Default is True.
+
+    Returns:
+        Dict with status, timezone, and "overview", "list", "summary" and "statistics" entries
+        shaped like the responses of the corresponding tools.
+
+    Note: All timestamps are in the Owner User Timezone. Display times using the
+    "timezone" field from the response, never label as UTC.
+    """
+    # Simple security checks
+    if not system_name or len(system_name) > 100:
+        return {"status": "error", "message": "Invalid system_name"}
+
+    try:
+        api_client = _get_api_client()
+        # Resolve owner timezone and the query window for this system
+        try:
+            tz_name, system_name, start_time_ms, end_time_ms = await _resolve_time_window(
+                system_name, start_time, end_time
+            )
+        except ValueError as e:
+            return {"status": "error", "message": str(e)}
+
+        # One unfiltered fetch serves every view; list and summary apply the
+        # isIncident filter themselves
+        result = await _cached_get_incidents(api_client, system_name, start_time_ms, end_time_ms)
+
+        if result["status"] != "success":
+            return result
+
+        def build_bundle(result: Dict[str, Any]) -> Dict[str, Any]:
+            return {
+                "status": "success",
+                "system_name": system_name,
+                "timezone": tz_name,
+                "overview": _build_overview(
+                    result, system_name, tz_name, start_time_ms, end_time_ms, None, include_consolidated
+                ),
+                "list": _build_incidents_list(
+                    result, system_name, tz_name, start_time_ms, end_time_ms,
+                    list_limit, only_true_incidents, include_consolidated, include_human_timestamps,
+                ),
+                "summary": _build_incidents_summary(
+                    result, system_name, tz_name, start_time_ms, end_time_ms,
+                    summary_limit, only_true_incidents, True, include_consolidated,
+                    include_human_timestamps,
+                ),
+                "statistics": _build_statistics(
+                    result, system_name, tz_name, start_time_ms, end_time_ms, include_consolidated
+                ),
             }
 
-        return {
-            "status": "success",
-            "system_name": system_name,
-            "timezone": tz_name,
-            "time_range": {
-                "start_human": format_timestamp_in_user_timezone(start_time_ms, tz_name),
-                "end_human": format_timestamp_in_user_timezone(end_time_ms, tz_name)
-            },
-            "statistics": statistics
-        }
+        return await _build_off_loop(build_bundle, result)
 
     except Exception as e:
-        error_message = f"Error in get_incidents_statistics: {str(e)}"
-        if settings.ENABLE_DEBUG_MESSAGES:
+        error_message = f"Error in get_incidents_bundle: {str(e)}"
+        if _DEBUG_ENABLED:
             print(error_message, file=sys.stderr)
         return {"status": "error", "message": error_message}
 
@@ -1103,25 +689,16 @@ async def fetch_traces(
                        If not provided, defaults to the current time.
     """
     try:
-        # Resolve owner timezone for this system
-        tz_name, system_name = await resolve_system_timezone(system_name)
-
-        # Convert string timestamps to integers if needed
+        api_client = _get_api_client()
+        # Resolve owner timezone and the query window for this system
         try:
-            start_time_ms, end_time_ms = parse_time_parameters(start_time, end_time, tz_name)
+            tz_name, system_name, start_time_ms, end_time_ms = await _resolve_query_window(
+                system_name, start_time, end_time
+            )
         except ValueError as e:
             return {"status": "error", "message": str(e)}
-        
-        # Set default time range if not provided (timezone-aware)
-        if end_time_ms is None or start_time_ms is None:
-            default_start_ms, default_end_ms = get_time_range_ms(tz_name, 1)
-            if end_time_ms is None:
-                end_time_ms = default_end_ms
-            if start_time_ms is None:
-                start_time_ms = default_start_ms
 
         # Call the InsightFinder API client with the timeline endpoint
-        api_client = _get_api_client()
         result = await api_client.get_traces(
             system_name=system_name,
             start_time_ms=start_time_ms,
@@ -1132,7 +709,7 @@ async def fetch_traces(
         
     except Exception as e:
         error_message = f"Error in fetch_traces: {str(e)}"
-        if settings.ENABLE_DEBUG_MESSAGES:
+        if _DEBUG_ENABLED:
             print(error_message, file=sys.stderr)
         return {"status": "error", "message": error_message}
 
@@ -1158,25 +735,16 @@ async def fetch_log_anomalies(
                        If not provided, defaults to the current time.
     """
     try:
-        # Resolve owner timezone for this system
-        tz_name, system_name = await resolve_system_timezone(system_name)
-
-        # Convert string timestamps to integers if needed
+        api_client = _get_api_client()
+        # Resolve owner timezone and the query window for this system
         try:
-            start_time_ms, end_time_ms = parse_time_parameters(start_time, end_time, tz_name)
+            tz_name, system_name, start_time_ms, end_time_ms = await _resolve_query_window(
+                system_name, start_time, end_time
+            )
         except ValueError as e:
             return {"status": "error", "message": str(e)}
-        
-        # Set default time range if not provided (timezone-aware)
-        if end_time_ms is None or start_time_ms is None:
-            default_start_ms, default_end_ms = get_time_range_ms(tz_name, 1)
-            if end_time_ms is None:
-                end_time_ms = default_end_ms
-            if start_time_ms is None:
-                start_time_ms = default_start_ms
 
         # Call the InsightFinder API client with the timeline endpoint
-        api_client = _get_api_client()
         result = await api_client.get_loganomaly(
             system_name=system_name,
             start_time_ms=start_time_ms,
@@ -1187,7 +755,7 @@ async def fetch_log_anomalies(
         
     except Exception as e:
         error_message = f"Error in fetch_log_anomalies: {str(e)}"
-        if settings.ENABLE_DEBUG_MESSAGES:
+        if _DEBUG_ENABLED:
             print(error_message, file=sys.stderr)
         return {"status": "error", "message": error_message}
 
@@ -1213,25 +781,16 @@ async def fetch_deployments(
                        If not provided, defaults to the current time.
     """
     try:
-        # Resolve owner timezone for this system
-        tz_name, system_name = await resolve_system_timezone(system_name)
-
-        # Convert string timestamps to integers if needed
+        api_client = _get_api_client()
+        # Resolve owner timezone and the query window for this system
         try:
-            start_time_ms, end_time_ms = parse_time_parameters(start_time, end_time, tz_name)
+            tz_name, system_name, start_time_ms, end_time_ms = await _resolve_query_window(
+                system_name, start_time, end_time
+            )
         except ValueError as e:
             return {"status": "error", "message": str(e)}
-        
-        # Set default time range if not provided (timezone-aware)
-        if end_time_ms is None or start_time_ms is None:
-            default_start_ms, default_end_ms = get_time_range_ms(tz_name, 1)
-            if end_time_ms is None:
-                end_time_ms = default_end_ms
-            if start_time_ms is None:
-                start_time_ms = default_start_ms
 
         # Call the InsightFinder API client with the timeline endpoint
-        api_client = _get_api_client()
         result = await api_client.get_deployment(
             system_name=system_name,
             start_time_ms=start_time_ms,
@@ -1242,7 +801,7 @@ async def fetch_deployments(
         
     except Exception as e:
         error_message = f"Error in fetch_deployments: {str(e)}"
-        if settings.ENABLE_DEBUG_MESSAGES:
+        if _DEBUG_ENABLED:
             print(error_message, file=sys.stderr)
         return {"status": "error", "message": error_message}
 
@@ -1277,38 +836,25 @@ async def get_project_incidents(
         limit (int): Maximum number of incidents to return (default: 20)
     """
     try:
-        # Resolve owner timezone for this system
-        tz_name, system_name = await resolve_system_timezone(system_name)
-
-        # Convert string timestamps to integers if needed
+        api_client = _get_api_client()
+        # Resolve owner timezone and the query window for this system
         try:
-            start_time_ms, end_time_ms = parse_time_parameters(start_time, end_time, tz_name)
+            tz_name, system_name, start_time_ms, end_time_ms = await _resolve_query_window(
+                system_name, start_time, end_time
+            )
         except ValueError as e:
             return {"status": "error", "message": str(e)}
-        
-        # Set default time range if not provided (timezone-aware)
-        if end_time_ms is None or start_time_ms is None:
-            default_start_ms, default_end_ms = get_time_range_ms(tz_name, 1)
-            if end_time_ms is None:
-                end_time_ms = default_end_ms
-            if start_time_ms is None:
-                start_time_ms = default_start_ms
 
         # Log input parameters for debugging
         logger.debug(
             "get_project_incidents called with system_name=%s, project_name=%s, start_time_ms=%s, end_time_ms=%s, only_true_incidents=%s, limit=%s",
             system_name, project_name, start_time_ms, end_time_ms, only_true_incidents, limit
         )
-        if settings.ENABLE_DEBUG_MESSAGES:
+        if _DEBUG_ENABLED:
             print(f"[DEBUG] get_project_incidents params: system_name={system_name}, project_name={project_name}, start_time_ms={start_time_ms}, end_time_ms={end_time_ms}, only_true_incidents={only_true_incidents}, limit={limit}", file=sys.stderr)
 
         # Call the InsightFinder API client with ONLY the system name
-        api_client = _get_api_client()
-        result = await api_client.get_incidents(
-            system_name=system_name,  # Use only the system name here
-            start_time_ms=start_time_ms,
-            end_time_ms=end_time_ms,
-        )
+        result = await _cached_get_incidents(api_client, system_name, start_time_ms, end_time_ms)
 
         if result["status"] != "success":
             return result
@@ -1317,51 +863,46 @@ async def get_project_incidents(
         
         # Filter by the specific project name
         # project_incidents = [i for i in incidents if i.get("projectName") == project_name]
-        project_incidents = [i for i in incidents if i.get("projectName", "").lower() == project_name.lower() or i.get("projectDisplayName", "").lower() == project_name.lower()]
+        project_name_lower = project_name.lower()
+        project_incidents = [i for i in incidents if i.get("projectName", "").lower() == project_name_lower or i.get("projectDisplayName", "").lower() == project_name_lower]
+        project_incidents_found = len(project_incidents)
         
-        # Filter for true incidents if requested
+        # Filter for true incidents if requested, streamed into the top-N pick
         if only_true_incidents:
-            project_incidents = [i for i in project_incidents if i.get("isIncident", False)]
+            project_incidents = (i for i in project_incidents if i.get("isIncident", False))
         
-        # Sort by timestamp (most recent first) and limit
-        project_incidents = sorted(project_incidents, key=lambda x: x.get("timestamp", 0), reverse=True)[:limit]
+        # Most recent first, limited; nlargest avoids sorting the whole list
+        project_incidents = heapq.nlargest(limit, project_incidents, key=itemgetter("timestamp"))
 
         # Create detailed incident list for the project
         incident_list = []
         for i, incident in enumerate(project_incidents):
+            get = incident.get
+            ts = incident["timestamp"]
+            rc = get("rootCause") or {}
             incident_info = {
                 "id": i + 1,
-                "timestamp": incident["timestamp"],
-                "timestamp_human": format_api_timestamp_corrected(incident["timestamp"], tz_name),
-                "project": incident.get("projectDisplayName", "Unknown"),
-                "component": incident.get("componentName", "Unknown"),
-                "instance": incident.get("instanceName", "Unknown"),
+                "timestamp": ts,
+                "timestamp_human": format_api_timestamp_corrected(ts, tz_name),
+                "project": get("projectDisplayName", "Unknown"),
+                "component": get("componentName", "Unknown"),
+                "instance": get("instanceName", "Unknown"),
+                # Metric name goes right after instance, only if available
+                **({"metricName": rc["metricName"]} if "metricName" in rc else {}),
+                "pattern": get("patternName", "Unknown"),
+                "anomaly_score": round(get("anomalyScore", 0), 2),
+                "is_incident": get("isIncident", False),
+                "status": get("status", "unknown"),
+                "active": get("active", False),
+                # Root cause summary, only if available
+                **({"root_cause": {
+                    "metricName": rc.get("metricName", "Unknown"),
+                    "metricType": rc.get("metricType", "Unknown"),
+                    "anomalyValue": rc.get("anomalyValue", 0),
+                    "percentage": rc.get("percentage", 0),
+                    "sign": rc.get("sign", "unknown")
+                }} if rc else {}),
             }
-            
-            # Add metric name right after instance only if available
-            if "rootCause" in incident and incident["rootCause"] and "metricName" in incident["rootCause"]:
-                incident_info["metricName"] = incident["rootCause"]["metricName"]
-            
-            # Add remaining fields
-            incident_info.update({
-                "pattern": incident.get("patternName", "Unknown"),
-                "anomaly_score": round(incident.get("anomalyScore", 0), 2),
-                "is_incident": incident.get("isIncident", False),
-                "status": incident.get("status", "unknown"),
-                "active": incident.get("active", False)
-            })
-
-            
-            # Add root cause summary if available
-            if "rootCause" in incident and incident["rootCause"]:
-                root_cause = incident["rootCause"]
-                incident_info["root_cause"] = {
-                    "metricName": root_cause.get("metricName", "Unknown"),
-                    "metricType": root_cause.get("metricType", "Unknown"),
-                    "anomalyValue": root_cause.get("anomalyValue", 0),
-                    "percentage": root_cause.get("percentage", 0),
-                    "sign": root_cause.get("sign", "unknown")
-                }
 
             snow = _extract_servicenow_info(incident)
             if snow:
@@ -1383,14 +924,14 @@ async def get_project_incidents(
                 "limit": limit
             },
             "total_system_incidents": len(incidents),
-            "project_incidents_found": len([i for i in incidents if i.get("projectDisplayName") == project_name or i.get("projectName") == project_name]),
+            "project_incidents_found": project_incidents_found,
             "returned_count": len(incident_list),
             "incidents": incident_list
         }
         
     except Exception as e:
         error_message = f"Error in get_project_incidents: {str(e)}"
-        if settings.ENABLE_DEBUG_MESSAGES:
+        if _DEBUG_ENABLED:
             print(error_message, file=sys.stderr)
         return {"status": "error", "message": error_message}
 
@@ -1399,6 +940,7 @@ async def predict_incidents(
     system_name: str,
     start_time: str,
     end_time: str,
+    limit: Optional[int] = None,
 ) -> Dict[str, Any]:
     """
     Predicts future incidents for a system in a given time window.
@@ -1416,11 +958,13 @@ async def predict_incidents(
                          Accepts: "2026-02-12T11:05:00", "2026-02-12", "02/12/2026".
         end_time (str): End of the prediction window.
                        Accepts: "2026-02-12T11:05:00", "2026-02-12", "02/12/2026".
+        limit (Optional[int]): Return only the earliest N predicted incidents (default: all).
 
     Returns:
         Dict[str, Any]: Prediction results, including recommendations if any are available.
     """
     try:
+        api_client = _get_api_client()
         # Security checks
         if not system_name or len(system_name) > 100:
             return {"status": "error", "message": "Invalid system_name"}
@@ -1438,7 +982,6 @@ async def predict_incidents(
             return {"status": "error", "message": "start_time and end_time are required for predictions"}
 
         # Call the InsightFinder API client
-        api_client = _get_api_client()
         result = await api_client.predict_incidents(
             system_name=system_name,
             start_time_ms=start_time_ms,
@@ -1450,7 +993,14 @@ async def predict_incidents(
 
         timeline_list = result["data"]
 
-        timeline_list = sorted(timeline_list, key=lambda x: x.get("predictionTime", 0), reverse=False)
+        # Every row reads predictionTime below, so itemgetter is safe; the
+        # response list isn't shared, so it can be sorted in place. With a
+        # limit, nsmallest avoids sorting (and fetching recommendations for)
+        # the tail.
+        if limit is not None and limit >= 0:
+            timeline_list = heapq.nsmallest(limit, timeline_list, key=itemgetter("predictionTime"))
+        else:
+            timeline_list.sort(key=itemgetter("predictionTime"))
 
         # # Remove rootCause/rootCauseResultInfo/rootCauseInfoKey and handle projectName
         # for incident in timeline_list:
@@ -1468,44 +1018,36 @@ async def predict_incidents(
         #     print(f"[DEBUG] Predicted incident timestamp: {incident.get('timestamp')} - {format_api_timestamp_corrected(incident.get('timestamp', tz_name))}", file=sys.stderr)
 
 
+        # Recommendation lookups are independent, so run them concurrently
+        recommendations = await _fetch_recommendations(api_client, timeline_list)
+
         incident_list = []
         for i, incident in enumerate(timeline_list):
+            get = incident.get
+            prediction_ts = incident["predictionTime"]
+            occurrence_ts = incident["predictionOccurenceTime"]
+            rc = get("rootCause") or {}
             incident_info = {
                 "id": i + 1,
-                "timestamp_prediction": incident["predictionTime"],
-                "timestamp_prediction_human": format_api_timestamp_corrected(incident["predictionTime"], tz_name),
-                "timestamp_occurence_prediction": incident["predictionOccurenceTime"],
-                "timestamp_occurence_prediction_human": format_api_timestamp_corrected(incident["predictionOccurenceTime"], tz_name),
-                "project": incident.get("projectDisplayName", "Unknown"),
-                "component": incident.get("componentName", "Unknown"),
-                "instance": incident.get("instanceName", "Unknown"),
+                "timestamp_prediction": prediction_ts,
+                "timestamp_prediction_human": _fmt_api(prediction_ts, tz_name),
+                "timestamp_occurence_prediction": occurrence_ts,
+                "timestamp_occurence_prediction_human": _fmt_api(occurrence_ts, tz_name),
+                "project": get("projectDisplayName", "Unknown"),
+                "component": get("componentName", "Unknown"),
+                "instance": get("instanceName", "Unknown"),
+                # Metric name goes right after instance, only if available
+                **({"metricName": rc["metricName"]} if "metricName" in rc else {}),
+                "pattern": get("patternName", "Unknown"),
+                # "anomaly_score": round(get("anomalyScore", 0), 2),
+                "is_incident": get("isIncident", False),
+                "status": get("status", "unknown"),
+                "active": get("active", False),
             }
-            
-            # Add metric name right after instance only if available
-            if "rootCause" in incident and incident["rootCause"] and "metricName" in incident["rootCause"]:
-                incident_info["metricName"] = incident["rootCause"]["metricName"]
-            
-            # Add remaining fields
-            incident_info.update({
-                "pattern": incident.get("patternName", "Unknown"),
-                # "anomaly_score": round(incident.get("anomalyScore", 0), 2),
-                "is_incident": incident.get("isIncident", False),
-                "status": incident.get("status", "unknown"),
-                "active": incident.get("active", False)
-            })
-
-            incident_llm_key = incident.get("incidentLLMKey")
-            user_name = incident.get("userName", "")
-            if incident_llm_key:
-                try:
-                    recommendation = await api_client.fetch_recommendation(
-                        incident_llm_key=incident_llm_key,
-                        customer_name=user_name
-                    )
-                    if recommendation:
-                        incident_info["recommendation"] = recommendation
-                except Exception as e:
-                    pass # Ignore recommendation fetch errors
+
+            recommendation = recommendations.get(i)
+            if recommendation:
+                incident_info["recommendation"] = recommendation
 
             snow = _extract_servicenow_info(incident)
             if snow:
@@ -1537,16 +1079,16 @@ async def predict_incidents(
             "time_range": {
                 "start": start_time_ms,
                 "end": end_time_ms,
-                "start_human": format_timestamp_in_user_timezone(start_time_ms, tz_name),
-                "end_human": format_timestamp_in_user_timezone(end_time_ms, tz_name)
+                "start_human": _fmt_user(start_time_ms, tz_name),
+                "end_human": _fmt_user(end_time_ms, tz_name)
             },
             "predicted_incidents": incident_list,
             "returned_count": len(incident_list)
         }
     except Exception as e:
         error_message = f"Error in predict_incidents: {str(e)}"
-        if settings.ENABLE_DEBUG_MESSAGES:
-            print(error_message)
+        if _DEBUG_ENABLED:
+            print(error_message, file=sys.stderr)
         return {"status": "error", "message": error_message}
 
 @mcp_server.tool()
@@ -1589,37 +1131,16 @@ async def get_consolidated_incidents_report(
         Dict with consolidated incident list, type breakdown, and the primary incidents they belong to.
     """
     try:
-        tz_name, system_name = await resolve_system_timezone(system_name)
-
+        api_client = _get_api_client()
+        # Resolve owner timezone and the query window; this report defaults to today
         try:
-            start_time_ms, end_time_ms = parse_time_parameters(start_time, end_time, tz_name)
+            tz_name, system_name, start_time_ms, end_time_ms = await _resolve_time_window(
+                system_name, start_time, end_time, default_keyword="today"
+            )
         except ValueError as e:
             return {"status": "error", "message": str(e)}
 
-        if end_time_ms is None or start_time_ms is None:
-            default_start_ms, default_end_ms = parse_relative_date_keyword("today", tz_name)
-            if end_time_ms is None:
-                end_time_ms = default_end_ms
-            if start_time_ms is None:
-                start_time_ms = default_start_ms
-
-        if start_time_ms is not None and end_time_ms is not None and start_time_ms == end_time_ms:
-            import datetime
-            dt = datetime.datetime.fromtimestamp(start_time_ms / 1000, tz=datetime.timezone.utc)
-            start_dt = dt.replace(hour=0, minute=0, second=0, microsecond=0)
-            end_dt = dt.replace(hour=23, minute=59, second=59, microsecond=999000)
-            start_time_ms = int(start_dt.timestamp() * 1000)
-            end_time_ms = int(end_dt.timestamp() * 1000)
-
-        if start_time_ms is None or end_time_ms is None:
-            return {"status": "error", "message": "Could not determine time range."}
-
-        api_client = _get_api_client()
-        result = await api_client.get_incidents(
-            system_name=system_name,
-            start_time_ms=start_time_ms,
-            end_time_ms=end_time_ms,
-        )
+        result = await _cached_get_incidents(api_client, system_name, start_time_ms, end_time_ms)
 
         if result["status"] != "success":
             return result
@@ -1643,22 +1164,22 @@ async def get_consolidated_incidents_report(
 
         # Tally flagDesc across all items in both timelineList and consolidatedTimelineList
         for item in primary_incidents:
-            flag_desc = (item.get("dampeningFlagInfo") or {}).get("flagDesc", "") or "Instance level content similarity consolidation"
+            flag_desc = (item.get("dampeningFlagInfo") or {}).get("flagDesc", "") or _DEFAULT_FLAG_DESC
             flag_counts[flag_desc] = flag_counts.get(flag_desc, 0) + 1
         for item in consolidated_data:
-            flag_desc = (item.get("dampeningFlagInfo") or {}).get("flagDesc", "") or "Instance level content similarity consolidation"
+            flag_desc = (item.get("dampeningFlagInfo") or {}).get("flagDesc", "") or _DEFAULT_FLAG_DESC
             flag_counts[flag_desc] = flag_counts.get(flag_desc, 0) + 1
         # Remaining = total_incidents - total object count; represents count-field excess with no known type
         total_incidents_val = sum(i.get("count", 0) for i in primary_incidents) + referenced_consolidated_count
         excess = total_incidents_val - (len(primary_incidents) + len(consolidated_data))
         if excess > 0:
-            flag_counts["Instance level content similarity consolidation"] = flag_counts.get("Instance level content similarity consolidation", 0) + excess
+            flag_counts[_DEFAULT_FLAG_DESC] = flag_counts.get(_DEFAULT_FLAG_DESC, 0) + excess
 
         for rid, primary in id_to_primary.items():
             c = consolidated_index.get(rid)
             if not c:
                 continue
-            flag_desc = (c.get("dampeningFlagInfo") or {}).get("flagDesc", "") or "Instance level content similarity consolidation"
+            flag_desc = (c.get("dampeningFlagInfo") or {}).get("flagDesc", "") or _DEFAULT_FLAG_DESC
             # Filter by consolidation_type if provided — match against flagDesc (case-insensitive)
             if consolidation_type and consolidation_type.upper() not in flag_desc.upper():
                 continue
@@ -1674,9 +1195,8 @@ async def get_consolidated_incidents_report(
             }
             report_entries.append(entry)
 
-        # Sort by timestamp descending, apply limit
-        report_entries.sort(key=lambda x: x.get("timestamp", 0), reverse=True)
-        report_entries = report_entries[:limit]
+        # Most recent first, limited; nlargest avoids sorting the whole list
+        report_entries = heapq.nlargest(limit, report_entries, key=itemgetter("timestamp"))
 
         return {
             "status": "success",
@@ -1703,11 +1223,955 @@ async def get_consolidated_incidents_report(
 
     except Exception as e:
         error_message = f"Error in get_consolidated_incidents_report: {str(e)}"
-        if settings.ENABLE_DEBUG_MESSAGES:
+        if _DEBUG_ENABLED:
             print(error_message, file=sys.stderr)
         return {"status": "error", "message": error_message}
 
 
+@functools.lru_cache(maxsize=64)
+def _default_time_range(tz_name: str, second: int) -> Tuple[int, int]:
+    """get_time_range_ms(tz_name, 1), computed once per wall-clock second."""
+    return get_time_range_ms(tz_name, 1)
+
+
+async def _resolve_query_window(
+    system_name: str,
+    start_time: Optional[str],
+    end_time: Optional[str],
+    default_keyword: Optional[str] = None,
+) -> Tuple[str, str, int, int]:
+    """
+    Resolve the owner timezone and parse the query window, filling missing
+    ends from the default 24-hour window, or from the range of
+    default_keyword (e.g. "today") when one is given.
+
+    Tools called within the same second get the same default window, so
+    their get_incidents calls share a cache entry.
+
+    Returns:
+        (tz_name, resolved_system_name, start_time_ms, end_time_ms)
+
+    Raises:
+        ValueError: If the time parameters cannot be parsed
+    """
+    tz_name, system_name = await resolve_system_timezone(system_name)
+
+    start_time_ms, end_time_ms = parse_time_parameters(start_time, end_time, tz_name)
+
+    # Set default time range if not provided (timezone-aware)
+    if end_time_ms is None or start_time_ms is None:
+        if default_keyword:
+            default_start_ms, default_end_ms = parse_relative_date_keyword(default_keyword, tz_name)
+        else:
+            default_start_ms, default_end_ms = _default_time_range(tz_name, int(time.time()))
+        if end_time_ms is None:
+            end_time_ms = default_end_ms
+        if start_time_ms is None:
+            start_time_ms = default_start_ms
+
+    return tz_name, system_name, start_time_ms, end_time_ms
+
+
+async def _resolve_time_window(
+    system_name: str,
+    start_time: Optional[str],
+    end_time: Optional[str],
+    default_keyword: Optional[str] = None,
+) -> Tuple[str, str, int, int]:
+    """
+    Resolve the owner timezone and query window shared by the incident tools.
+
+    Parses keyword/absolute start and end times, fills missing ends with the
+    default 24-hour window (or default_keyword's range, see
+    _resolve_query_window) and expands an equal start/end to the full day.
+
+    Returns:
+        (tz_name, resolved_system_name, start_time_ms, end_time_ms)
+
+    Raises:
+        ValueError: If the time parameters cannot be parsed
+    """
+    tz_name, system_name, start_time_ms, end_time_ms = await _resolve_query_window(
+        system_name, start_time, end_time, default_keyword
+    )
+
+    # If start and end time are the same (e.g. user provided "2026-02-12" for both),
+    # expand to cover the full day (00:00:00.000 to 23:59:59.999).
+    # We treat the timestamp as UTC because it's already "fake UTC" (owner wall-clock).
+    if start_time_ms == end_time_ms:
+        start_time_ms -= start_time_ms % _DAY_MS
+        end_time_ms = start_time_ms + _DAY_MS - 1
+
+        if _DEBUG_ENABLED:
+            logger.debug(f"Expanded equal start/end time to full day: {start_time_ms} - {end_time_ms}")
+
+    return tz_name, system_name, start_time_ms, end_time_ms
+
+
+async def _cached_get_incidents(
+    api_client,
+    system_name: str,
+    start_time_ms: int,
+    end_time_ms: int,
+) -> Dict[str, Any]:
+    """
+    api_client.get_incidents() with a short TTL cache; only successful responses are cached.
+
+    Concurrent calls for the same key wait for a single in-flight request.
+    Rows repeating an incident id are dropped here, once per fetch, so every
+    view built from the response counts the same rows.
+    """
+    key = (
+        api_client.user_name,
+        api_client.base_url,
+        system_name,
+        start_time_ms,
+        end_time_ms,
+    )
+
+    def _lookup():
+        entry = _INCIDENTS_CACHE.get(key)
+        if entry and time.monotonic() - entry[0] < _INCIDENTS_CACHE_TTL_S:
+            _INCIDENTS_CACHE.move_to_end(key)
+            return entry[1]
+        return None
+
+    result = _lookup()
+    if result is not None:
+        return result
+
+    lock_entry = _INCIDENTS_LOCKS.get(key)
+    if lock_entry is None:
+        lock_entry = _INCIDENTS_LOCKS[key] = [asyncio.Lock(), 0]
+    lock_entry[1] += 1
+    try:
+        async with lock_entry[0]:
+            result = _lookup()
+            if result is not None:
+                return result
+
+            result = await api_client.get_incidents(
+                system_name=system_name,
+                start_time_ms=start_time_ms,
+                end_time_ms=end_time_ms,
+            )
+            if result.get("status") == "success":
+                data = result.get("data")
+                if data:
+                    unique = list(_unique_incidents(data))
+                    if len(unique) != len(data):
+                        result = {**result, "data": unique}
+                _INCIDENTS_CACHE[key] = (time.monotonic(), result)
+                _INCIDENTS_CACHE.move_to_end(key)
+                while len(_INCIDENTS_CACHE) > _INCIDENTS_CACHE_MAX:
+                    _INCIDENTS_CACHE.popitem(last=False)
+            return result
+    finally:
+        # Waiters still queued on the lock keep it alive, so a caller arriving
+        # now joins them instead of starting a parallel fetch
+        lock_entry[1] -= 1
+        if not lock_entry[1]:
+            del _INCIDENTS_LOCKS[key]
+
+
+async def _fetch_one_incident(
+    api_client,
+    system_name: str,
+    incident_timestamp: str,
+    instance_name: Optional[str] = None,
+    pattern_id: Optional[str] = None,
+    pattern_name: Optional[str] = None,
+    exact: bool = False,
+) -> Tuple[bool, Dict[str, Any]]:
+    """
+    Looks up one incident for the single-incident tools: resolves the owner
+    timezone, parses incident_timestamp and makes one (cached) fetch of the
+    _INCIDENT_LOOKUP_WINDOW_MS window around it.
+
+    With exact=True the row stamped exactly at incident_timestamp is picked,
+    as get_incident_raw_data does; otherwise the true incident is matched the
+    way get_incident_details does (by minute, or by the optional filters).
+
+    Returns:
+        (found, lookup): when found, lookup holds "tz_name" and the matched
+        "incident" row; otherwise it is the error response.
+    """
+    # Resolve owner timezone for this system
+    tz_name, system_name = await resolve_system_timezone(system_name)
+
+    # Convert any human-readable timestamp to InsightFinder fake-UTC ms
+    try:
+        timestamp_ms = convert_to_ms(incident_timestamp, "incident_timestamp", tz_name)
+    except ValueError as e:
+        return False, {"status": "error", "message": str(e)}
+
+    if timestamp_ms is None:
+        return False, {"status": "error", "message": "incident_timestamp is required"}
+
+    # Cached, so paging through RCA batches or following the details with the
+    # raw data doesn't refetch the window
+    start_time = timestamp_ms - _INCIDENT_LOOKUP_WINDOW_MS
+    end_time = timestamp_ms + _INCIDENT_LOOKUP_WINDOW_MS
+    result = await _cached_get_incidents(api_client, system_name, start_time, end_time)
+
+    if result["status"] != "success":
+        return False, result
+
+    if exact:
+        incident_data = next((i for i in result["data"] if i["timestamp"] == timestamp_ms), None)
+        if not incident_data:
+            return False, {"status": "error", "message": f"Incident with timestamp {timestamp_ms} not found"}
+        return True, {"tz_name": tz_name, "incident": incident_data}
+
+    # Filter only true incidents
+    incidents = [i for i in result["data"] if i.get('isIncident', False)]
+
+    # Only the filters that were actually provided take part in the match
+    filters = [
+        (key, value)
+        for key, value in (("instanceName", instance_name), ("patternId", pattern_id), ("patternName", pattern_name))
+        if value is not None
+    ]
+
+    if not filters:
+        # Timestamp match at minute granularity (ignoring seconds and milliseconds)
+        target_timestamp_minutes = timestamp_ms // 60000
+        incident_data = next(
+            (inc for inc in incidents if inc.get('timestamp', 0) // 60000 == target_timestamp_minutes),
+            None,
+        )
+    else:
+        # Filter by optional parameters; the API already limited the time window
+        incident_data = next(
+            (inc for inc in incidents if all(inc.get(key) == value for key, value in filters)),
+            None,
+        )
+
+        # If no match found with filters, return the first incident in the time window
+        if incident_data is None and incidents:
+            incident_data = incidents[0]
+
+    if not incident_data:
+        return False, {"status": "error", "message": "No incident found with the specified timestamp"}
+    return True, {"tz_name": tz_name, "incident": incident_data}
+
+
+async def _build_off_loop(builder: Callable[..., Dict[str, Any]], result: Dict[str, Any], *args: Any) -> Dict[str, Any]:
+    """
+    Run builder(result, *args), in a worker thread when the result is large.
+
+    The builders only read the (possibly cached and shared) result, so they
+    are safe to run off the event loop. Small results stay inline to avoid
+    the thread hop.
+    """
+    if len(result["data"]) + len(result.get("consolidated_data", ())) < _OFFLOAD_MIN_ROWS:
+        return builder(result, *args)
+    return await asyncio.to_thread(builder, result, *args)
+
+
+def _build_overview(
+    result: Dict[str, Any],
+    system_name: str,
+    tz_name: str,
+    start_time_ms: int,
+    end_time_ms: int,
+    project_name: Optional[str],
+    include_consolidated: bool,
+) -> Dict[str, Any]:
+    """Build the get_incidents_overview response from a get_incidents result."""
+    incidents = result["data"]
+    consolidated_data = result.get("consolidated_data", [])
+
+    # Filter by project name if specified
+    if project_name:
+        project_name_lower = project_name.lower()
+        incidents = [
+            i for i in incidents
+            if i.get("projectName", "").lower() == project_name_lower
+            or i.get("projectDisplayName", "").lower() == project_name_lower
+        ]
+
+    # primary_count is the number of primary incident objects; total uses count fields
+    primary_count = len(incidents)
+
+    # Walk the primaries once: count totals, first/last timestamps,
+    # unique dimension values and, if requested, consolidation flags.
+    flag_counts: Counter = Counter()
+    primary_total = 0
+    primaries_with_consolidation = 0
+    first_incident = last_incident = None
+    components = set()
+    instances = set()
+    patterns = set()
+    projects = set()
+    add_component = components.add
+    add_instance = instances.add
+    add_pattern = patterns.add
+    add_project = projects.add
+    for incident in incidents:
+        get = incident.get
+        primary_total += get("count", 0)
+        if get("relatedTimelineIdList"):
+            primaries_with_consolidation += 1
+        ts = incident["timestamp"]
+        if first_incident is None or ts < first_incident:
+            first_incident = ts
+        if last_incident is None or ts > last_incident:
+            last_incident = ts
+        add_component(get("componentName", "Unknown"))
+        add_instance(get("instanceName", "Unknown"))
+        add_pattern(get("patternName", "Unknown"))
+        add_project(get("projectDisplayName", "Unknown"))
+        if include_consolidated:
+            flag_counts[(get("dampeningFlagInfo") or {}).get("flagDesc", "") or _DEFAULT_FLAG_DESC] += 1
+
+    consolidated_count = 0
+    for item in consolidated_data:
+        get = item.get
+        consolidated_count += get("count", 0)
+        if include_consolidated:
+            flag_counts[(get("dampeningFlagInfo") or {}).get("flagDesc", "") or _DEFAULT_FLAG_DESC] += 1
+    total_incidents = primary_total + consolidated_count
+
+    summary = {
+        "total_incidents": total_incidents,
+        "consolidated_incidents": primary_count,
+        "suppressed_incidents": total_incidents - primary_count,
+        "primaries_with_consolidation": primaries_with_consolidation,
+        "unique_components": len(components),
+        "unique_instances": len(instances),
+        "unique_patterns": len(patterns),
+        "unique_projects": len(projects),
+        "first_event": _fmt_api(first_incident, tz_name) if first_incident else None,
+        "last_event": _fmt_api(last_incident, tz_name) if last_incident else None,
+        "has_incidents": total_incidents > 0
+    }
+
+    if include_consolidated:
+        # flagDesc was tallied across timelineList and consolidatedTimelineList above.
+        # Remaining = total_incidents - total object count; represents count-field excess with no known type
+        excess = total_incidents - (primary_count + len(consolidated_data))
+        if excess > 0:
+            flag_counts[_DEFAULT_FLAG_DESC] += excess
+        summary["consolidation_breakdown"] = dict(flag_counts)
+
+    return _make_overview_return(system_name, tz_name, start_time_ms, end_time_ms, summary)
+
+
+def _build_incidents_list(
+    result: Dict[str, Any],
+    system_name: str,
+    tz_name: str,
+    start_time_ms: int,
+    end_time_ms: int,
+    limit: int,
+    only_true_incidents: bool,
+    include_consolidated: bool,
+    include_human_timestamps: bool = True,
+) -> Dict[str, Any]:
+    """Build the get_incidents_list response from a get_incidents result."""
+    incidents = result["data"]
+    consolidated_data = result.get("consolidated_data", [])
+    consolidated_index = _build_consolidated_index(consolidated_data)
+
+    # Filter for true incidents if requested, streamed into the top-N pick
+    if only_true_incidents:
+        incidents = (i for i in incidents if i.get("isIncident", False))
+
+    # Most recent first, limited; nlargest avoids sorting the whole list
+    incidents = heapq.nlargest(limit, incidents, key=itemgetter("timestamp"))
+
+    # Create compact incident list
+    incident_list = []
+    append = incident_list.append
+    fmt_api = _fmt_api
+    for idx, incident in enumerate(incidents, 1):
+        get = incident.get
+        ts = incident["timestamp"]
+        rc = get("rootCause") or {}
+        score = get("anomalyScore", 0)
+        incident_info = {
+            "id": idx,
+            "timestamp": ts,
+            # Skipped entirely when the caller formats timestamps itself
+            **({"timestamp_human": fmt_api(ts, tz_name)} if include_human_timestamps else {}),
+            "projectDisplayName": get("projectDisplayName", "Unknown"),
+            "realProjectName": get("projectName", "Unknown"),
+            "component": get("componentName", "Unknown"),
+            "instance": get("instanceName", "Unknown"),
+            # Metric name goes right after instance, only if available
+            **({"metricName": rc["metricName"]} if "metricName" in rc else {}),
+            "pattern": get("patternName", "Unknown"),
+            # Truncating instead of rounding would misreport e.g. 0.29 as 0.28
+            "anomaly_score": round(score, 2) if score else score,
+            "is_incident": get("isIncident", False),
+            "status": get("status", "unknown"),
+        }
+
+        snow = _extract_servicenow_info(incident)
+        if snow:
+            incident_info["servicenow_ticket"] = snow
+
+        if include_consolidated:
+            consolidated = _attach_consolidated(incident, consolidated_index, tz_name)
+            incident_info["consolidated_incidents"] = consolidated
+            incident_info["consolidated_count"] = len(consolidated)
+
+        append(incident_info)
+
+    time_range = {
+        "start_human": _fmt_user(start_time_ms, tz_name),
+        "end_human": _fmt_user(end_time_ms, tz_name)
+    }
+    return _make_incident_rows_return(
+        system_name, only_true_incidents, limit, include_consolidated,
+        time_range, len(result["data"]), incident_list, len(consolidated_data),
+    )
+
+
+def _build_incidents_summary(
+    result: Dict[str, Any],
+    system_name: str,
+    tz_name: str,
+    start_time_ms: int,
+    end_time_ms: int,
+    limit: int,
+    only_true_incidents: bool,
+    include_root_cause_info: bool,
+    include_consolidated: bool,
+    include_human_timestamps: bool = True,
+) -> Dict[str, Any]:
+    """Build the get_incidents_summary response from a get_incidents result."""
+    incidents = result["data"]
+    consolidated_data = result.get("consolidated_data", [])
+    consolidated_index = _build_consolidated_index(consolidated_data)
+
+    # Filter for true incidents if requested, streamed into the top-N pick
+    if only_true_incidents:
+        incidents = (i for i in incidents if i.get("isIncident", False))
+
+    # Most recent first, limited; nlargest avoids sorting the whole list
+    incidents = heapq.nlargest(limit, incidents, key=itemgetter("timestamp"))
+
+    # Extract detailed summary information
+    incidents_summary = []
+    append = incidents_summary.append
+    fmt_api = _fmt_api
+    for idx, incident in enumerate(incidents, 1):
+        get = incident.get
+        ts = incident["timestamp"]
+
+        rc = get("rootCause")
+        rcri = get("rootCauseResultInfo") or {}
+        summary = {
+            "incident_id": idx,
+            "timestamp": ts,
+        }
+        if include_human_timestamps:
+            summary["timestamp_human"] = fmt_api(ts, tz_name)
+        # Descriptive fields are only emitted when set (see docstring)
+        _put_if_set(summary, "projectDisplayName", get("projectDisplayName"))
+        _put_if_set(summary, "realProjectName", get("projectName"))
+        _put_if_set(summary, "instanceName", get("instanceName"))
+        if rc:
+            _put_if_set(summary, "metricName", rc.get("metricName"))
+        _put_if_set(summary, "componentName", get("componentName"))
+        _put_if_set(summary, "patternName", get("patternName"))
+        _put_if_set(summary, "anomalyScore", get("anomalyScore"), 0)
+        _put_if_set(summary, "status", get("status"))
+        _put_if_set(summary, "isIncident", get("isIncident"), False)
+        summary["has_raw_data"] = get("rawData") is not None
+        summary["has_root_cause"] = rcri.get('hasPrecedingEvent', False) or rc is not None
+
+        # Add root cause information if available
+        if include_root_cause_info:
+            root_cause_info = {}
+
+            if rcri:
+                root_cause_info["result_info"] = {
+                    "hasPrecedingEvent": rcri.get("hasPrecedingEvent", False),
+                    "hasTrailingEvent": rcri.get("hasTrailingEvent", False),
+                    "causedByChangeEvent": rcri.get("causedByChangeEvent", False),
+                }
+
+            info_key = get("rootCauseInfoKey")
+            if info_key:
+                root_cause_info["info_key"] = {
+                    "projectName": info_key.get("projectName"),
+                    "instanceName": info_key.get("instanceName"),
+                    "incidentTimestamp": info_key.get("incidentTimestamp")
+                }
+
+            if root_cause_info:
+                summary["root_cause_info"] = root_cause_info
+
+        snow = _extract_servicenow_info(incident)
+        if snow:
+            summary["servicenow_ticket"] = snow
+
+        if include_consolidated:
+            consolidated = _attach_consolidated(incident, consolidated_index, tz_name)
+            summary["consolidated_incidents"] = consolidated
+            summary["consolidated_count"] = len(consolidated)
+
+        append(summary)
+
+    time_range = {
+        "start": start_time_ms,
+        "end": end_time_ms,
+        "start_human": _fmt_user(start_time_ms, tz_name),
+        "end_human": _fmt_user(end_time_ms, tz_name)
+    }
+    return _make_incident_rows_return(
+        system_name, only_true_incidents, limit, include_consolidated,
+        time_range, len(result["data"]), incidents_summary, len(consolidated_data),
+    )
+
+
+def _build_statistics(
+    result: Dict[str, Any],
+    system_name: str,
+    tz_name: str,
+    start_time_ms: int,
+    end_time_ms: int,
+    include_consolidated: bool,
+) -> Dict[str, Any]:
+    """Build the get_incidents_statistics response from a get_incidents result."""
+    incidents = result["data"]
+    consolidated_data = result.get("consolidated_data", [])
+
+    # primary_count is the number of primary incident objects; total uses count fields
+    primary_count = len(incidents)
+    referenced_consolidated_count = sum(c.get("count", 0) for c in consolidated_data)
+    total_incident_count = sum(i.get("count", 0) for i in incidents) + referenced_consolidated_count
+
+    # most_common keeps first-seen order among equal counts, like the stable sort it replaces
+    statistics: Dict[str, Any] = {
+        "total_incidents": total_incident_count,
+        "consolidated_incidents": primary_count,
+        "suppressed_incidents": total_incident_count - primary_count,
+        "top_affected_components": _top_values(incidents, "componentName"),
+        "top_affected_instances": _top_values(incidents, "instanceName"),
+        "top_patterns": _top_values(incidents, "patternName"),
+        "top_affected_projects": _top_values(incidents, "projectDisplayName")
+    }
+
+    if include_consolidated:
+        # Tally flagDesc across all items in both timelineList and consolidatedTimelineList
+        flag_counts = Counter(
+            (item.get("dampeningFlagInfo") or {}).get("flagDesc", "") or _DEFAULT_FLAG_DESC
+            for items in (incidents, consolidated_data)
+            for item in items
+        )
+        # Remaining = total_incidents - total object count; represents count-field excess with no known type
+        excess = total_incident_count - (primary_count + len(consolidated_data))
+        if excess > 0:
+            flag_counts[_DEFAULT_FLAG_DESC] += excess
+
+        statistics["consolidated_breakdown"] = {
+            "total_suppressed": referenced_consolidated_count,
+            "consolidation_type_breakdown": dict(flag_counts),
+            "top_affected_components": _top_values(consolidated_data, "componentName"),
+            "top_affected_instances": _top_values(consolidated_data, "instanceName"),
+            "top_patterns": _top_values(consolidated_data, "patternName"),
+            "top_affected_projects": _top_values(consolidated_data, "projectDisplayName")
+        }
+
+    return {
+        "status": "success",
+        "system_name": system_name,
+        "timezone": tz_name,
+        "time_range": {
+            "start_human": format_timestamp_in_user_timezone(start_time_ms, tz_name),
+            "end_human": format_timestamp_in_user_timezone(end_time_ms, tz_name)
+        },
+        "statistics": statistics
+    }
+
+
+async def _build_incident_details(
+    client,
+    incident_data: Dict[str, Any],
+    tz_name: str,
+    include_root_cause: bool,
+    fetch_rca_chain: bool,
+    include_recommendations: bool,
+    rca_batch_offset: int,
+    rca_batch_size: int,
+) -> Dict[str, Any]:
+    """Builds the get_incident_details response for one incident row."""
+    recommendation_task = None
+    try:
+        result_incident = incident_data.copy()  # For clarity in the result structure
+        result_incident.pop('rawData', None)  # Remove raw data to keep response manageable
+        result_incident.pop('rootCause', None)  # Remove root cause summary to avoid confusion
+        result_incident.pop('rootCauseResultInfo', None)  # Remove root cause result info to avoid confusion
+        result_incident.pop('rootCauseInfoKey', None)  # Remove root cause info key to avoid confusion
+        result_incident.pop('incidentLLMKey', None)  # Remove incidentLLMKey to avoid confusion
+
+        # Extract metric name if available in rootCause
+        rc = incident_data.get("rootCause")
+        metric_name = rc["metricName"] if rc and "metricName" in rc else None
+
+        snow = _extract_servicenow_info(incident_data)
+        result = {
+            "metricName": metric_name,
+            "incident": result_incident,
+            "raw_data_available": True,  # Indicate that raw data can be fetched separately
+            "root_cause_available": False,
+            "root_cause_chain": None,
+            "recommendation_available": False,
+            "recommendation": None,
+            "anomalyScore": incident_data.get("anomalyScore"),
+            "status": incident_data.get("status"),
+            "isIncident": incident_data.get("isIncident"),
+            "active": incident_data.get("active"),
+            "projectDisplayName": incident_data.get("projectDisplayName", "Unknown"),
+            "realProjectName": incident_data.get("projectName", "Unknown"),
+            "servicenow_ticket": snow
+        }
+
+        # The recommendation fetch doesn't depend on the RCA lookups below,
+        # so start it now and collect it once they are done
+        incident_llm_key = incident_data.get('incidentLLMKey')
+        if include_recommendations and incident_llm_key:
+            # print(f"[DEBUG] Fetching recommendations for incidentLLMKey: {incident_llm_key}")
+            recommendation_task = asyncio.ensure_future(client.fetch_recommendation(
+                incident_llm_key=incident_llm_key,
+                customer_name=incident_data.get('userName', '')
+            ))
+
+        # Check if root cause analysis is available and requested
+        root_cause_info = incident_data.get('rootCauseInfoKey')
+        if include_root_cause and fetch_rca_chain:
+            # Try the LLM summary API first
+            llm_summary = None
+            # get timestamp from rootCauseInfoKey.incidentTimestamp if available, otherwise use incident timestamp
+            llm_root_cause_timestamp = root_cause_info.get('incidentTimestamp') if root_cause_info and 'incidentTimestamp' in root_cause_info else incident_data.get('timestamp')
+            if incident_llm_key:
+                try:
+                    project_info = await client.get_customer_name_for_project(
+                        incident_llm_key.get('projectName', '')
+                    )
+                    system_id = project_info[4] if project_info else ''
+                    if system_id:
+                        llm_summary = await client.fetch_incident_llm_summary(
+                            user_name=incident_llm_key.get('userName', ''),
+                            project_name=incident_llm_key.get('projectName', ''),
+                            instance_name=incident_llm_key.get('instanceName', ''),
+                            timestamp=llm_root_cause_timestamp,
+                            pattern_id=incident_llm_key.get('patternId', 0),
+                            system_name=system_id
+                        )
+                        # logger.debug(f"LLM summary fetch result: {str(llm_summary)}")
+                        logger.info(f"LLM summary fetch successful {llm_summary}")
+                except Exception as e:
+                    logger.warning(f"Failed to fetch incident LLM summary: {str(e)}")
+
+            if llm_summary:
+                logger.info("RCA source: LLM summary API")
+                result["root_cause_chain"] = llm_summary
+                result["root_cause_available"] = True
+                result["root_cause_chain_event_count"] = 1
+            elif root_cause_info:
+                # Fallback: fetch the structured RCA chain
+                try:
+                    # The merged chain is cached so follow-up batch requests
+                    # don't refetch and reprocess it
+                    rca_cache_key = _rca_chain_cache_key(client, root_cause_info, tz_name)
+                    merged_nodes = _rca_chain_cache_get(rca_cache_key)
+                    if merged_nodes is None:
+                        # print(f"[DEBUG] Fetching RCA chain for rootCauseInfoKey: {root_cause_info}", file=sys.stderr)
+                        rca_data = await client.fetch_root_cause_analysis(
+                            root_cause_info_key=root_cause_info,
+                            customer_name=incident_data.get('userName', '')
+                        )
+                        rca_chain = rca_data.get('rcaChainList', [])
+                        # Sort the RCA chain by the earliest eventTimestamp in each rcaNodeList
+                        if isinstance(rca_chain, list) and rca_chain and 'rcaNodeList' in rca_chain[0]:
+                            rca_chain = sorted(rca_chain, key=_min_event_timestamp)
+
+                        # The same sourceDetail/content strings repeat across chains,
+                        # so each distinct payload is parsed only once
+                        parsed_payloads = {}
+                        # Nodes share timestamps heavily; the memoized formatter
+                        # renders each distinct value once
+                        fmt_user = _fmt_user
+                        # Optionally, sort each rcaNodeList by eventTimestamp as well
+                        for chain_item in rca_chain:
+                            node_list = chain_item.get('rcaNodeList', [])
+                            if not (isinstance(node_list, list) and node_list and 'eventTimestamp' in node_list[0]):
+                                continue
+                            unique_nodes = {}
+                            for node in node_list:
+                                # Keep the numeric timestamp for ordering before it is formatted
+                                event_ts = node.get('eventTimestamp', 0)
+                                # Format didPredictionTime and eventEndTimestamp if present
+                                for ts_field in ('didPredictionTime', 'eventEndTimestamp', 'eventTimestamp'):
+                                    if ts_field in node:
+                                        node[ts_field] = fmt_user(node[ts_field], tz_name)
+
+                                # Replace sourceProjectName with sourceProjectDisplayName and remove the display name
+                                if 'sourceProjectDisplayName' in node:
+                                    node['sourceProjectName'] = node['sourceProjectDisplayName']
+                                    node.pop('sourceProjectDisplayName', None)
+
+                                # Parse and extract key fields from sourceDetail if present;
+                                # most nodes carry none and go straight to the key
+                                source_detail = node.get('sourceDetail')
+                                if source_detail:
+                                    try:
+                                        _apply_rca_source_detail(node, source_detail, parsed_payloads)
+                                    except Exception:
+                                        pass
+                                # Build deduplication key
+                                key = (node.get('nid'), node.get('patternName'), node.get('sourceInstanceName'), node.get('sourceProjectName'))
+                                # Nodes were already updated in place above, so the first
+                                # one seen for a key is kept as-is without a copy
+                                unique_nodes.setdefault(key, (event_ts, node))
+                            # Remove nid from each node to reduce clutter
+                            # for n in deduped_nodes:
+                            #     n.pop('nid', None)
+                            chain_item['rcaNodeList'] = [node for _, node in sorted(unique_nodes.values(), key=itemgetter(0))]
+
+
+                        merged_nodes = merge_rca_chain(rca_chain)
+                        _rca_chain_cache_put(rca_cache_key, merged_nodes)
+
+                    total_events = len(merged_nodes)
+                    batch_offset = max(rca_batch_offset, 0)
+                    batch_end = batch_offset + rca_batch_size if rca_batch_size > 0 else total_events
+                    batch = merged_nodes[batch_offset:batch_end]
+                    logger.info("RCA source: fallback structured chain (%d events)", total_events)
+                    result["root_cause_chain"] = batch
+                    result["root_cause_chain_event_count"] = total_events
+                    result["rca_batch"] = {
+                        "offset": batch_offset,
+                        "returned": len(batch),
+                        "remaining": max(total_events - batch_offset - len(batch), 0),
+                    }
+                    result['root_cause_available'] = True
+                    # include the count of events in the chain
+                    # result['root_cause_chain_event_count'] = sum(len(item.get('rcaNodeList', [])) for item in rca_chain)
+                    # result['root_cause_chain'] = rca_chain
+                    # print(f"[DEBUG] RCA chain fetch result: {str(result['root_cause_chain'])}", file=sys.stderr)
+                    # print(f"[DEBUG] RCA chain event count: {result['root_cause_chain_event_count']}", file=sys.stderr)
+                except Exception as e:
+                    logger.warning(f"Failed to fetch root cause analysis: {str(e)}")
+        
+        # Check if root cause info is available in the incident data
+        if include_root_cause and incident_data.get('rootCauseResultInfo', {}).get('hasPrecedingEvent', False):
+            result['root_cause_available'] = True
+            if not result.get('root_cause_chain'):
+                result['root_cause_chain'] = []
+        
+        # Collect recommendations if requested and incident LLM key is available
+        if recommendation_task is not None:
+            try:
+                recommendation = await recommendation_task
+                if recommendation:
+                    result['recommendation_available'] = True
+                    result['recommendation'] = recommendation
+                    # print(f"[DEBUG] Recommendation fetch result: {str(result['recommendation'])}", file=sys.stderr)
+            except Exception as e:
+                logger.warning(f"Failed to fetch recommendations: {str(e)}")
+
+        return result
+
+    except Exception:
+        if recommendation_task is not None:
+            recommendation_task.cancel()
+        raise
+
+
+def _build_incident_raw_data(target_incident: Dict[str, Any], tz_name: str, max_length: int) -> Dict[str, Any]:
+    """Builds the get_incident_raw_data response for one incident row."""
+    timestamp_ms = target_incident["timestamp"]
+    raw_data = target_incident.get("rawData", "")
+    if not raw_data:
+        return {"status": "error", "message": "No raw data available for this incident"}
+    raw_data_length = len(raw_data)
+
+    # Truncate if too long
+    if raw_data_length > max_length:
+        raw_data = raw_data[:max_length] + f"\n... [TRUNCATED - Full length: {raw_data_length} characters]"
+
+    result = {
+        "status": "success",
+        "incident_timestamp": timestamp_ms,
+        "timestamp_human": format_api_timestamp_corrected(timestamp_ms, tz_name),
+        "projectName": target_incident.get("projectDisplayName"),
+        "instanceName": target_incident.get("instanceName"),
+    }
+    
+    # Add metric name right after instanceName only if available
+    rc = target_incident.get("rootCause")
+    if rc and "metricName" in rc:
+        result["metricName"] = rc["metricName"]
+    
+    # Add remaining fields
+    result["componentName"] = target_incident.get("componentName")
+    result["raw_data"] = raw_data
+    result["raw_data_length"] = raw_data_length
+    result["truncated"] = raw_data_length > max_length
+    
+    return result
+
+
+# Response constructors for the layer tools. Every response keeps the same
+# key order and holds only JSON primitives (str/int/float/bool/None plus
+# lists and dicts); timestamps are ints or preformatted strings, never
+# datetime objects, so the MCP layer can serialize them directly.
+def _make_overview_return(
+    system_name: str,
+    tz_name: str,
+    start_time_ms: int,
+    end_time_ms: int,
+    summary: Dict[str, Any],
+) -> Dict[str, Any]:
+    return {
+        "status": "success",
+        "system_name": system_name,
+        "timezone": tz_name,
+        "time_range": {
+            "start_human": _fmt_user(start_time_ms, tz_name),
+            "end_human": _fmt_user(end_time_ms, tz_name)
+        },
+        "summary": summary
+    }
+
+
+def _make_incident_rows_return(
+    system_name: str,
+    only_true_incidents: bool,
+    limit: int,
+    include_consolidated: bool,
+    time_range: Dict[str, Any],
+    total_found: int,
+    rows: List[Dict[str, Any]],
+    total_consolidated_found: int,
+) -> Dict[str, Any]:
+    response = {
+        "status": "success",
+        "system_name": system_name,
+        "filters": {
+            "only_true_incidents": only_true_incidents,
+            "limit": limit,
+            "include_consolidated": include_consolidated
+        },
+        "time_range": time_range,
+        "total_found": total_found,
+        "returned_count": len(rows),
+        "incidents": rows
+    }
+    if include_consolidated:
+        response["total_consolidated_found"] = total_consolidated_found
+    return response
+
+
+def _rca_chain_cache_key(api_client, root_cause_info: dict, tz_name: str) -> tuple:
+    # tz_name is part of the key: the cached nodes carry timestamps already
+    # formatted for the owner timezone
+    return (api_client.user_name, api_client.base_url, tz_name, json.dumps(root_cause_info, sort_keys=True, default=str))
+
+
+def _rca_chain_cache_get(key: tuple) -> Optional[list]:
+    entry = _RCA_CHAIN_CACHE.get(key)
+    if entry and time.monotonic() - entry[0] < _RCA_CHAIN_CACHE_TTL_S:
+        _RCA_CHAIN_CACHE.move_to_end(key)
+        return entry[1]
+    return None
+
+
+def _rca_chain_cache_put(key: tuple, merged_nodes: list) -> None:
+    _RCA_CHAIN_CACHE[key] = (time.monotonic(), merged_nodes)
+    _RCA_CHAIN_CACHE.move_to_end(key)
+    while len(_RCA_CHAIN_CACHE) > _RCA_CHAIN_CACHE_MAX:
+        _RCA_CHAIN_CACHE.popitem(last=False)
+
+
+def _put_if_set(target: dict, key: str, value: Any, default: Any = None) -> None:
+    """Set target[key] only when value is present, non-empty and not the default."""
+    if value is not None and value != "" and value != default:
+        target[key] = value
+
+
+def _json_loads(payload: str) -> Any:
+    """
+    json.loads() through orjson when it is installed.
+
+    orjson is stricter than the stdlib parser (no NaN/Infinity literals or
+    lone surrogates), so anything it rejects is retried with json.loads and
+    both paths accept the same payloads.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(payload)
+
+
+def _apply_rca_source_detail(node: dict, source_detail: str, parsed_payloads: Dict[str, Any]) -> None:
+    """
+    Lift nid, patternName and key_fields from an RCA node's sourceDetail JSON
+    into the node, then drop sourceDetail. Raises if sourceDetail can't be parsed.
+
+    parsed_payloads memoizes parsed sourceDetail/content strings across the
+    nodes of one RCA fetch; the parsed objects are only read, never modified.
+    """
+    detail_obj = parsed_payloads.get(source_detail)
+    if detail_obj is None:
+        detail_obj = parsed_payloads[source_detail] = _json_loads(source_detail)
+    if detail_obj:
+        if detail_obj.get('nid'):
+            node['nid'] = detail_obj['nid']
+        if detail_obj.get('patternName'):
+            node['patternName'] = detail_obj['patternName']
+        if detail_obj.get('content'):
+            content_str = detail_obj['content']
+            try:
+                if isinstance(content_str, str):
+                    content = parsed_payloads.get(content_str)
+                    if content is None:
+                        content = parsed_payloads[content_str] = _json_loads(content_str)
+                else:
+                    content = content_str
+            except Exception:
+                content = content_str
+            # Extract common fields if they exist
+            if isinstance(content, dict):
+                extracted_fields = {
+                    field: value for field in _RCA_COMMON_FIELDS
+                    if (value := content.get(field, _MISSING)) is not _MISSING
+                }
+                if extracted_fields:
+                    node["key_fields"] = extracted_fields
+    node.pop('sourceDetail', None)  # Remove the original sourceDetail to reduce clutter
+
+
+def _min_event_timestamp(chain_item: dict) -> float:
+    """Sort key for RCA chains: the earliest eventTimestamp in the chain's rcaNodeList."""
+    node_list = chain_item.get('rcaNodeList', [])
+    return min(
+        (node['eventTimestamp'] for node in node_list if 'eventTimestamp' in node),
+        default=math.inf,
+    )
+
+
+def _unique_incidents(incidents: Iterable[dict]) -> Iterator[dict]:
+    """Yield incidents, dropping repeats of an incident id; rows without an id are all kept."""
+    seen = set()
+    add = seen.add
+    for incident in incidents:
+        incident_id = incident.get("id")
+        if incident_id is None:
+            yield incident
+        elif incident_id not in seen:
+            add(incident_id)
+            yield incident
+
+
 def _build_consolidated_index(consolidated_data: list) -> dict:
     """Build a dict mapping incident id -> consolidated incident record."""
     return {item["id"]: item for item in consolidated_data if "id" in item}
@@ -1745,6 +2209,45 @@ def _attach_consolidated(incident: dict, consolidated_index: dict, tz_name: str)
     return result
 
 
+async def _fetch_recommendations(api_client, incidents: List[dict]) -> Dict[int, Any]:
+    """
+    Fetch the recommendation for each incident that has an incidentLLMKey.
+
+    Returns a map from incident index to recommendation, holding only the
+    incidents that got one; incidents without a key never enter the batch.
+    Incidents sharing the same (incidentLLMKey, userName) share one request,
+    and at most _RECOMMENDATION_CONCURRENCY requests are in flight.
+    """
+    # incidentLLMKey is a dict, so dedupe on its canonical JSON form
+    needs_rec: List[Tuple[int, str]] = []
+    unique: Dict[str, Tuple[Any, str]] = {}
+    for i, incident in enumerate(incidents):
+        incident_llm_key = incident.get("incidentLLMKey")
+        if not incident_llm_key:
+            continue
+        customer_name = incident.get("userName", "")
+        request_key = json.dumps([incident_llm_key, customer_name], sort_keys=True, default=str)
+        unique.setdefault(request_key, (incident_llm_key, customer_name))
+        needs_rec.append((i, request_key))
+
+    if not unique:
+        return {}
+
+    try:
+        results = await api_client.fetch_recommendations(
+            list(unique.values()), max_concurrency=_RECOMMENDATION_CONCURRENCY
+        )
+    except Exception:
+        return {}  # Ignore recommendation fetch errors
+    by_key = dict(zip(unique, results))
+    return {i: by_key[request_key] for i, request_key in needs_rec if by_key[request_key]}
+
+
+def _top_values(items: List[dict], field: str, n: int = 10) -> Dict[str, int]:
+    """Count values of field across items (missing -> "Unknown") and return the n most common."""
+    return dict(Counter(item.get(field, "Unknown") for item in items).most_common(n))
+
+
 def _extract_servicenow_info(incident: dict) -> Optional[dict]:
     """Extract ServiceNow ticket number and hyperlink from an incident, if present."""
     snow = incident.get("serviceNowTimelineInfo")
@@ -1761,6 +2264,10 @@ def _extract_servicenow_info(incident: dict) -> Optional[dict]:
 def _get_api_client():
     """
     Get the API client for the current request context.
+
+    Tools call this once at the top and reuse the result. The client already
+    lives in a per-request context variable, so there is no separate cache:
+    a module-level one would leak credentials between requests.
     
     Returns:
         InsightFinderAPIClient: The API client configured for the current request
@@ -1770,11 +2277,7 @@ def _get_api_client():
     """
     api_client = get_current_api_client()
     if not api_client:
-        raise ValueError(
-            "InsightFinder API client not available. "
-            "This tool requires InsightFinder credentials in HTTP headers: "
-            "X-InsightFinder-License-Key and X-InsightFinder-User-Name"
-        )
+        raise ValueError(_NO_API_CLIENT_MESSAGE)
     return api_client
 
 def merge_rca_chain(rca_chain: list) -> list:
@@ -1783,38 +2286,31 @@ def merge_rca_chain(rca_chain: list) -> list:
     Deduplication is based on (sourceInstanceName, sourceProjectName, patternName, eventTimestamp).
     Also transforms 'probability' field to 'confidenceScore' for consistency.
     """
-    unique_nodes = {}
+    seen = set()
     merged_nodes = []
+    append = merged_nodes.append
 
     for chain_item in rca_chain:
         node_list = chain_item.get("rcaNodeList", [])
         for node in node_list:
+            get = node.get
             # Deduplication key
             key = (
-                node.get("sourceInstanceName"),
-                node.get("sourceProjectName"),
-                node.get("patternName"),
-                node.get("nid")
+                get("sourceInstanceName"),
+                get("sourceProjectName"),
+                get("patternName"),
+                get("nid")
             )
-            if key not in unique_nodes:
-                unique_nodes[key] = node
-
-    # Collect deduplicated nodes
-    merged_nodes = list(unique_nodes.values())
-
-    # Sort strictly by eventTimestamp (formatted string in owner timezone)
-    from datetime import datetime
-    def parse_ts(ts):
-        try:
-            return datetime.strptime(ts, "%Y-%m-%d %H:%M:%S %Z")
-        except Exception:
-            return ts  # fallback, keep order as-is
-
-    merged_nodes.sort(key=lambda n: parse_ts(n.get("eventTimestamp", "")))
-
-    # Transform 'probability' to 'confidenceScore' in merged nodes
-    for node in merged_nodes:
-        if "probability" in node:
-            node["confidenceScore"] = node.pop("probability")
+            if key not in seen:
+                seen.add(key)
+                # Transform 'probability' to 'confidenceScore' on kept nodes
+                if "probability" in node:
+                    node["confidenceScore"] = node.pop("probability")
+                append(node)
+
+    # Sort strictly by eventTimestamp. The values are fixed-width
+    # "YYYY-MM-DD HH:MM:SS (tz)" strings in one owner timezone, so string
+    # order is chronological; missing values sort first.
+    merged_nodes.sort(key=lambda n: n.get("eventTimestamp", ""))
 
     return merged_nodes
@@ -1,7 +1,9 @@
 import sys
+import heapq
 import json
 from typing import Dict, Any, Optional, List, Union, Union
 from datetime import datetime, timezone
+from operator import itemgetter
 
 from ..server import mcp_server
 from ...api_client.client_factory import get_current_api_client
@@ -268,33 +270,36 @@ async def get_log_anomalies_list(
 
         log_anomalies = result["data"]
         
-        # Filter by project name if specified
+        # Filter by project name if specified; the filter streams straight into the sort
         if project_name:
             # log_anomalies = [la for la in log_anomalies if la.get("projectName") == project_name]
-            log_anomalies = [la for la in log_anomalies if la.get("projectName", "").lower() == project_name.lower() or la.get("projectDisplayName", "").lower() == project_name.lower()]
+            project_name_lower = project_name.lower()
+            log_anomalies = (la for la in log_anomalies if la.get("projectName", "").lower() == project_name_lower or la.get("projectDisplayName", "").lower() == project_name_lower)
 
         # # Filter by anomaly type if specified (e.g. "whiteList")
         # if anomaly_type:
         #     log_anomalies = [la for la in log_anomalies if str(la.get("type", "")).lower() == anomaly_type.lower()]
 
-        # Sort by anomaly score (highest first) and limit
-        log_anomalies = sorted(log_anomalies, key=lambda x: x.get("anomalyScore", 0), reverse=True)[:limit]
+        # Highest anomaly score first, limited; nlargest avoids sorting every match
+        log_anomalies = heapq.nlargest(limit, log_anomalies, key=lambda x: x.get("anomalyScore", 0))
 
         # Create detailed anomaly list
         anomaly_list = []
         for i, anomaly in enumerate(log_anomalies):                
+            get = anomaly.get
+            ts = anomaly["timestamp"]
             anomaly_info = {
                 "id": i + 1,
-                "timestamp": anomaly["timestamp"],
-                "timestamp_human": format_api_timestamp_corrected(anomaly["timestamp"], tz_name),
-                "project": anomaly.get("projectDisplayName", "Unknown"),
-                "component": anomaly.get("componentName", "Unknown"),
-                "instance": anomaly.get("instanceName", "Unknown"),
-                "pattern": anomaly.get("patternName", "Unknown"),
-                "zone": anomaly.get("zoneName", "Unknown"),
-                "anomaly_score": round(anomaly.get("anomalyScore", 0), 2),
-                "is_incident": anomaly.get("isIncident", False),
-                "active": anomaly.get("active", 0)
+                "timestamp": ts,
+                "timestamp_human": format_api_timestamp_corrected(ts, tz_name),
+                "project": get("projectDisplayName", "Unknown"),
+                "component": get("componentName", "Unknown"),
+                "instance": get("instanceName", "Unknown"),
+                "pattern": get("patternName", "Unknown"),
+                "zone": get("zoneName", "Unknown"),
+                "anomaly_score": round(get("anomalyScore", 0), 2),
+                "is_incident": get("isIncident", False),
+                "active": get("active", 0)
             }
             
             # Add raw data if requested and available
@@ -476,25 +481,26 @@ async def get_log_anomalies_statistics(
         projects = {}
         
         for anomaly in log_anomalies:
+            get = anomaly.get
             # Component analysis
-            component = anomaly.get("componentName", "Unknown")
+            component = get("componentName", "Unknown")
             components[component] = components.get(component, 0) + 1
             
             # Instance analysis
-            instance = anomaly.get("instanceName", "Unknown")
+            instance = get("instanceName", "Unknown")
             instances[instance] = instances.get(instance, 0) + 1
             
             # Pattern analysis
-            pattern = anomaly.get("patternName", "Unknown")
+            pattern = get("patternName", "Unknown")
             patterns[pattern] = patterns.get(pattern, 0) + 1
             
             # Zone analysis
-            zone = anomaly.get("zoneName", "Unknown")
+            zone = get("zoneName", "Unknown")
             if zone != "Unknown":
                 zones[zone] = zones.get(zone, 0) + 1
                 
             # Project analysis
-            project = anomaly.get("projectDisplayName", "Unknown")
+            project = get("projectDisplayName", "Unknown")
             projects[project] = projects.get(project, 0) + 1
 
         # Score statistics
@@ -521,11 +527,11 @@ async def get_log_anomalies_statistics(
                     "min_score": round(min_score, 2),
                     "avg_score": round(avg_score, 2)
                 },
-                "top_affected_components": dict(sorted(components.items(), key=lambda x: x[1], reverse=True)[:10]),
-                "top_affected_instances": dict(sorted(instances.items(), key=lambda x: x[1], reverse=True)[:10]),
-                "top_patterns": dict(sorted(patterns.items(), key=lambda x: x[1], reverse=True)[:10]),
-                "top_affected_projects": dict(sorted(projects.items(), key=lambda x: x[1], reverse=True)[:10]),
-                "top_zones": dict(sorted(zones.items(), key=lambda x: x[1], reverse=True)[:10]) if zones else {}
+                "top_affected_components": dict(sorted(components.items(), key=itemgetter(1), reverse=True)[:10]),
+                "top_affected_instances": dict(sorted(instances.items(), key=itemgetter(1), reverse=True)[:10]),
+                "top_patterns": dict(sorted(patterns.items(), key=itemgetter(1), reverse=True)[:10]),
+                "top_affected_projects": dict(sorted(projects.items(), key=itemgetter(1), reverse=True)[:10]),
+                "top_zones": dict(sorted(zones.items(), key=itemgetter(1), reverse=True)[:10]) if zones else {}
             }
         }
         
@@ -663,21 +669,18 @@ async def get_project_log_anomalies(
         log_anomalies = result["data"]
         print(f"Retrieved {len(log_anomalies)} log anomalies for {system_name}", file=sys.stderr)
 
-        # Filter by the specific project name
+        # Filter by the specific project name, by instance name if provided (with
+        # smart matching for different formats), and always only to anomalies of
+        # type "whiteList" for project-specific queries -- all in one pass that
+        # feeds the sort, so no intermediate lists are built.
         # project_anomalies = [la for la in log_anomalies if la.get("projectName") == project_name]
-        project_anomalies = [la for la in log_anomalies if la.get("projectName", "").lower() == project_name.lower() or la.get("projectDisplayName", "").lower() == project_name.lower()]
-
-        # Filter by instance name if provided (with smart matching for different formats)
-        if instance_name:
-            project_anomalies = [
-                la for la in project_anomalies 
-                if _matches_instance_name(la.get("instanceName", ""), instance_name)
-            ]
-            # if settings.ENABLE_DEBUG_MESSAGES:
-            #     print(f"[Instance filter] Filtered by instance_name='{instance_name}', remaining: {len(project_anomalies)}", file=sys.stderr)
-
-        # Always only return anomalies of type "whiteList" for project-specific queries
-        project_anomalies = [la for la in project_anomalies if str(la.get("type", "")).lower() == "whitelist"]
+        project_name_lower = project_name.lower()
+        project_anomalies = (
+            la for la in log_anomalies
+            if (la.get("projectName", "").lower() == project_name_lower or la.get("projectDisplayName", "").lower() == project_name_lower)
+            and (not instance_name or _matches_instance_name(la.get("instanceName", ""), instance_name))
+            and str(la.get("type", "")).lower() == "whitelist"
+        )
 
         # Sort by timestamp (most recent first)
         project_anomalies = sorted(project_anomalies, key=lambda x: x.get("timestamp", 0), reverse=True)
@@ -692,18 +695,20 @@ async def get_project_log_anomalies(
         # Create detailed anomaly list for the project
         anomaly_list = []
         for i, anomaly in enumerate(paginated_anomalies):                
+            get = anomaly.get
+            ts = anomaly["timestamp"]
             anomaly_info = {
                 "id": offset + i + 1,  # Global ID based on offset
-                "timestamp": anomaly["timestamp"],
-                "timestamp_human": format_api_timestamp_corrected(anomaly["timestamp"], tz_name),
-                "project": anomaly.get("projectDisplayName", "Unknown"),
-                "component": anomaly.get("componentName", "Unknown"),
-                "instance": anomaly.get("instanceName", "Unknown"),
-                "pattern": anomaly.get("patternName", "Unknown"),
-                "zone": anomaly.get("zoneName", "Unknown"),
-                "anomaly_score": round(anomaly.get("anomalyScore", 0), 2),
-                "is_incident": anomaly.get("isIncident", False),
-                "active": anomaly.get("active", 0)
+                "timestamp": ts,
+                "timestamp_human": format_api_timestamp_corrected(ts, tz_name),
+                "project": get("projectDisplayName", "Unknown"),
+                "component": get("componentName", "Unknown"),
+                "instance": get("instanceName", "Unknown"),
+                "pattern": get("patternName", "Unknown"),
+                "zone": get("zoneName", "Unknown"),
+                "anomaly_score": round(get("anomalyScore", 0), 2),
+                "is_incident": get("isIncident", False),
+                "active": get("active", 0)
             }
             
             # Add raw data details if available
@@ -20,11 +20,13 @@ project_name filtering to focus on specific projects within a system.
 """
 
 import asyncio
+import heapq
 import json
 import logging
 import sys
 from typing import Dict, Any, List, Optional, Union
 from datetime import datetime, timezone
+from operator import itemgetter
 
 from ..server import mcp_server
 from ...api_client.client_factory import get_current_api_client
@@ -179,7 +181,7 @@ async def get_metric_anomalies_overview(
             pattern = anomaly.get("patternName", "Unknown")
             pattern_counts[pattern] = pattern_counts.get(pattern, 0) + 1
         
-        top_patterns = sorted(pattern_counts.items(), key=lambda x: x[1], reverse=True)[:3]
+        top_patterns = sorted(pattern_counts.items(), key=itemgetter(1), reverse=True)[:3]
         
         return {
             "status": "success",
@@ -622,7 +624,7 @@ async def get_metric_anomalies_statistics(
         
         # Calculate percentages and top items
         def get_top_items(counts_dict, top_n=5):
-            sorted_items = sorted(counts_dict.items(), key=lambda x: x[1], reverse=True)
+            sorted_items = sorted(counts_dict.items(), key=itemgetter(1), reverse=True)
             return {
                 item: {"count": count, "percentage": round(count / total_anomalies * 100, 1)}
                 for item, count in sorted_items[:top_n]
@@ -851,10 +853,11 @@ async def get_project_metric_anomalies(
         
         # Filter by the specific project name
         # project_anomalies = [ma for ma in metric_anomalies if ma.get("projectName") == project_name]
-        project_anomalies = [ma for ma in metric_anomalies if ma.get("projectName", "").lower() == project_name.lower() or ma.get("projectDisplayName", "").lower() == project_name.lower()]
+        project_name_lower = project_name.lower()
+        project_anomalies = (ma for ma in metric_anomalies if ma.get("projectName", "").lower() == project_name_lower or ma.get("projectDisplayName", "").lower() == project_name_lower)
         
-        # Sort by timestamp (most recent first) and limit
-        project_anomalies = sorted(project_anomalies, key=lambda x: x.get("timestamp", 0), reverse=True)[:limit]
+        # Most recent first, limited; nlargest avoids sorting every match
+        project_anomalies = heapq.nlargest(limit, project_anomalies, key=lambda x: x.get("timestamp", 0))
 
         # Create detailed anomaly list for the project
         anomaly_list = []
@@ -16,10 +16,12 @@ project_name filtering to focus on specific projects within a system.
 """
 
 import asyncio
+import heapq
 import json
 import logging
 from typing import Dict, Any, List, Optional, Union
 from datetime import datetime, timezone
+from operator import itemgetter
 import re
 
 from ..server import mcp_server
@@ -229,7 +231,7 @@ async def get_traces_overview(
             if op_name:
                 operation_counts[op_name] = operation_counts.get(op_name, 0) + 1
         
-        top_operations = sorted(operation_counts.items(), key=lambda x: x[1], reverse=True)[:3]
+        top_operations = sorted(operation_counts.items(), key=itemgetter(1), reverse=True)[:3]
         
         return {
             "status": "success",
@@ -1052,7 +1054,7 @@ async def get_traces_statistics(
         
         # Calculate percentages and top items
         def get_top_items(counts_dict, top_n=5):
-            sorted_items = sorted(counts_dict.items(), key=lambda x: x[1], reverse=True)
+            sorted_items = sorted(counts_dict.items(), key=itemgetter(1), reverse=True)
             return {
                 item: {"count": count, "percentage": round(count / total_traces * 100, 1)}
                 for item, count in sorted_items[:top_n]
@@ -1093,7 +1095,7 @@ async def get_traces_statistics(
                     "error_count": error_count,
                     "success_count": total_traces - error_count,
                     "error_rate_percentage": round(error_rate, 1),
-                    "top_error_operations": dict(sorted(error_operations.items(), key=lambda x: x[1], reverse=True)[:5])
+                    "top_error_operations": dict(sorted(error_operations.items(), key=itemgetter(1), reverse=True)[:5])
                 }
             },
             
@@ -1226,10 +1228,11 @@ async def get_project_traces(
         
         # Filter by the specific project name
         # project_traces = [t for t in traces if t.get("projectName") == project_name]
-        project_traces = [t for t in traces if t.get("projectName", "").lower() == project_name.lower() or t.get("projectDisplayName", "").lower() == project_name.lower()]
+        project_name_lower = project_name.lower()
+        project_traces = (t for t in traces if t.get("projectName", "").lower() == project_name_lower or t.get("projectDisplayName", "").lower() == project_name_lower)
         
-        # Sort by timestamp (most recent first) and limit
-        project_traces = sorted(project_traces, key=lambda x: x.get("timestamp", 0), reverse=True)[:limit]
+        # Most recent first, limited; nlargest avoids sorting every match
+        project_traces = heapq.nlargest(limit, project_traces, key=lambda x: x.get("timestamp", 0))
 
         # Create detailed trace list for the project
         trace_list = []
@@ -0,0 +1,91 @@
+import calendar
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from insightfinder_mcp_server.server.tools import get_time
+
+
+def _timegm_ms(dt):
+    """The fake-UTC ms for dt's wall clock, computed the original way."""
+    return calendar.timegm(dt.replace(tzinfo=None).timetuple()) * 1000
+
+
+TIMEZONES = ["UTC", "America/New_York", "Asia/Kolkata", "Australia/Lord_Howe"]
+
+INSTANTS = [
+    datetime(2026, 2, 12, 14, 30, 15, 123456, tzinfo=timezone.utc),
+    # Just after midnight UTC, and around the 2026 US/EU DST switches
+    datetime(2026, 3, 8, 0, 0, 1, tzinfo=timezone.utc),
+    datetime(2026, 3, 8, 7, 30, tzinfo=timezone.utc),
+    datetime(2026, 3, 29, 1, 30, tzinfo=timezone.utc),
+    datetime(2026, 11, 1, 5, 59, 59, 999999, tzinfo=timezone.utc),
+    datetime(2026, 12, 31, 23, 59, 59, tzinfo=timezone.utc),
+]
+
+
+@pytest.fixture(params=INSTANTS, ids=lambda instant: instant.isoformat())
+def frozen_now(request, monkeypatch):
+    instant = request.param
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return instant.astimezone(tz) if tz else instant.replace(tzinfo=None)
+
+    monkeypatch.setattr(get_time, "datetime", FrozenDatetime)
+    return instant
+
+
+@pytest.mark.parametrize("tz_name", TIMEZONES)
+def test_today_and_yesterday_match_date_arithmetic(frozen_now, tz_name):
+    today = frozen_now.astimezone(get_time._make_tz(tz_name)).date()
+    for keyword, day in (("today", today), ("yesterday", today - timedelta(days=1))):
+        expected = (
+            _timegm_ms(datetime.combine(day, datetime.min.time())),
+            _timegm_ms(datetime.combine(day, datetime.max.time())),
+        )
+        assert get_time.parse_relative_date_keyword(keyword, tz_name) == expected
+
+
+RELATIVE_OFFSETS = {
+    "1_hour_ago": timedelta(hours=1),
+    "6_hours_ago": timedelta(hours=6),
+    "12_hours_ago": timedelta(hours=12),
+    "24_hours_ago": timedelta(hours=24),
+    "1_week_ago": timedelta(days=7),
+    "1_month_ago": timedelta(days=30),
+}
+
+
+@pytest.mark.parametrize("tz_name", TIMEZONES)
+@pytest.mark.parametrize("instant", INSTANTS, ids=lambda instant: instant.isoformat())
+def test_relative_times_match_wall_clock_subtraction(tz_name, instant):
+    epoch_s = int(instant.timestamp())
+    now_local = datetime.fromtimestamp(epoch_s, get_time._make_tz(tz_name))
+
+    payload = json.loads(get_time._build_current_datetime(tz_name, epoch_s))
+    assert payload["current_time_milliseconds"] == _timegm_ms(now_local)
+    assert payload["relative_times_milliseconds"] == {
+        key: _timegm_ms(now_local - offset) for key, offset in RELATIVE_OFFSETS.items()
+    }
+
+    for hours_back in (1, 24, 24 * 7):
+        payload = json.loads(get_time._build_time_range(tz_name, hours_back, epoch_s))
+        assert payload["end_time"]["milliseconds"] == _timegm_ms(now_local)
+        assert payload["start_time"]["milliseconds"] == _timegm_ms(now_local - timedelta(hours=hours_back))
+
+
+@pytest.mark.parametrize("tz_name", TIMEZONES)
+@pytest.mark.parametrize("wall_clock", [
+    datetime(2026, 2, 12, 0, 0),
+    datetime(2026, 2, 12, 14, 30, 15, 999999),
+    datetime(1970, 1, 1, 0, 0, 0, 1),
+    datetime(1969, 12, 31, 23, 59, 59, 500000),
+    datetime(1900, 3, 1, 12, 0),
+    datetime(2099, 12, 31, 23, 59, 59),
+], ids=str)
+def test_wall_clock_to_fake_utc_ms_matches_timegm(tz_name, wall_clock):
+    dt_aware = wall_clock.replace(tzinfo=get_time._make_tz(tz_name))
+    assert get_time._wall_clock_to_fake_utc_ms(dt_aware) == _timegm_ms(dt_aware)
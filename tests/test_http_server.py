@@ -0,0 +1,49 @@
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from insightfinder_mcp_server.server import http_server
+from insightfinder_mcp_server.server.http_server import HTTPMCPServer
+
+
+PAYLOAD = {
+    "status": "success",
+    "system_name": "Zürich – prod",
+    "incidents": [
+        {"id": 1, "timestamp": 1770768000000, "anomaly_score": 1.25, "is_incident": True, "metricName": None},
+    ],
+    "generated_at": datetime(2026, 2, 11, 8, 30, tzinfo=timezone.utc),
+}
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def server(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(http_server, "orjson", None)
+    elif http_server.orjson is None:
+        pytest.skip("orjson is not installed")
+    # dumps_json only needs json_serializer, so skip building the FastAPI app
+    return HTTPMCPServer.__new__(HTTPMCPServer)
+
+
+def test_dumps_json_compact(server):
+    assert server.dumps_json(PAYLOAD) == (
+        '{"status":"success","system_name":"Zürich – prod","incidents":[{"id":1,'
+        '"timestamp":1770768000000,"anomaly_score":1.25,"is_incident":true,"metricName":null}],'
+        '"generated_at":"2026-02-11T08:30:00+00:00"}'
+    )
+
+
+def test_dumps_json_indented(server):
+    expected = dict(PAYLOAD, generated_at="2026-02-11T08:30:00+00:00")
+    assert server.dumps_json(PAYLOAD, indent=True) == json.dumps(expected, indent=2, ensure_ascii=False)
+
+
+def test_dumps_json_writes_non_finite_floats_as_null(server):
+    payload = {"scores": [float("nan"), float("inf"), -float("inf"), 0.5]}
+    assert server.dumps_json(payload) == '{"scores":[null,null,null,0.5]}'
+
+
+def test_dumps_json_non_string_keys_and_big_ints(server):
+    assert server.dumps_json({1: "a", "n": 2 ** 70}) == '{"1":"a","n":%d}' % 2 ** 70
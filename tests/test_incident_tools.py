@@ -0,0 +1,266 @@
+import asyncio
+import json
+
+import pytest
+
+from insightfinder_mcp_server.server.tools import incident_tools
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(incident_tools, "orjson", None)
+    elif incident_tools.orjson is None:
+        pytest.skip("orjson is not installed")
+    return request.param
+
+
+@pytest.mark.parametrize("payload", [
+    '{"nid": 3, "content": "{\\"metricName\\": \\"cpu\\"}"}',
+    '{"instanceName": "caf\\u00e9", "values": [1, 2.5, null, true]}',
+    '{"anomalyValue": Infinity}',
+    '"\\ud800"',
+])
+def test_json_loads_matches_stdlib(json_backend, payload):
+    assert incident_tools._json_loads(payload) == json.loads(payload)
+
+
+def test_json_loads_rejects_invalid_json(json_backend):
+    with pytest.raises(ValueError):
+        incident_tools._json_loads("{not json")
+
+
+class FakeClient:
+    """Stands in for InsightFinderAPIClient.get_incidents."""
+
+    def __init__(self, rows=(), user_name="alice", base_url="https://app.example.com"):
+        self.user_name = user_name
+        self.base_url = base_url
+        self.rows = list(rows)
+        self.error = None
+        self.status = "success"
+        self.calls = []
+
+    async def get_incidents(self, system_name, start_time_ms, end_time_ms):
+        self.calls.append((system_name, start_time_ms, end_time_ms))
+        await asyncio.sleep(0)
+        if self.error:
+            raise self.error
+        if self.status != "success":
+            return {"status": "error", "message": "boom"}
+        data = [row for row in self.rows if start_time_ms <= row["timestamp"] <= end_time_ms]
+        return {"status": "success", "data": data, "consolidated_data": []}
+
+
+@pytest.fixture(autouse=True)
+def clear_incidents_cache():
+    incident_tools._INCIDENTS_CACHE.clear()
+    incident_tools._INCIDENTS_LOCKS.clear()
+    yield
+    incident_tools._INCIDENTS_CACHE.clear()
+    incident_tools._INCIDENTS_LOCKS.clear()
+
+
+def test_cached_get_incidents_reuses_a_fetch_for_the_same_key():
+    client = FakeClient()
+
+    async def run():
+        first = await incident_tools._cached_get_incidents(client, "Prod", 0, 1000)
+        second = await incident_tools._cached_get_incidents(client, "Prod", 0, 1000)
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first is second
+    assert len(client.calls) == 1
+
+
+def test_cached_get_incidents_key_covers_client_system_and_window():
+    alice = FakeClient()
+    bob = FakeClient(user_name="bob")
+    other_host = FakeClient(base_url="https://other.example.com")
+
+    async def run():
+        await incident_tools._cached_get_incidents(alice, "Prod", 0, 1000)
+        await incident_tools._cached_get_incidents(alice, "Prod", 0, 2000)
+        await incident_tools._cached_get_incidents(alice, "Staging", 0, 1000)
+        await incident_tools._cached_get_incidents(bob, "Prod", 0, 1000)
+        await incident_tools._cached_get_incidents(other_host, "Prod", 0, 1000)
+
+    asyncio.run(run())
+    assert len(alice.calls) == 3
+    assert len(bob.calls) == 1
+    assert len(other_host.calls) == 1
+
+
+def test_cached_get_incidents_expires_after_ttl(monkeypatch):
+    client = FakeClient()
+    now = [1000.0]
+    monkeypatch.setattr(incident_tools.time, "monotonic", lambda: now[0])
+
+    async def fetch():
+        await incident_tools._cached_get_incidents(client, "Prod", 0, 1000)
+
+    asyncio.run(fetch())
+    now[0] += incident_tools._INCIDENTS_CACHE_TTL_S - 1
+    asyncio.run(fetch())
+    assert len(client.calls) == 1
+
+    now[0] += 2
+    asyncio.run(fetch())
+    assert len(client.calls) == 2
+
+
+def test_cached_get_incidents_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(incident_tools, "_INCIDENTS_CACHE_MAX", 2)
+    client = FakeClient()
+
+    async def run():
+        for end in (1000, 2000, 1000, 3000, 1000, 2000):
+            await incident_tools._cached_get_incidents(client, "Prod", 0, end)
+
+    asyncio.run(run())
+    # 2000 was evicted by 3000; 1000 stayed warm
+    assert [call[2] for call in client.calls] == [1000, 2000, 3000, 2000]
+
+
+def test_cached_get_incidents_coalesces_concurrent_calls():
+    client = FakeClient()
+
+    async def run():
+        return await asyncio.gather(
+            *(incident_tools._cached_get_incidents(client, "Prod", 0, 1000) for _ in range(5))
+        )
+
+    results = asyncio.run(run())
+    assert len(client.calls) == 1
+    assert all(result is results[0] for result in results)
+    assert not incident_tools._INCIDENTS_LOCKS
+
+
+def test_cached_get_incidents_does_not_cache_errors():
+    client = FakeClient()
+    client.status = "error"
+
+    async def fetch():
+        return await incident_tools._cached_get_incidents(client, "Prod", 0, 1000)
+
+    assert asyncio.run(fetch())["status"] == "error"
+    client.status = "success"
+    assert asyncio.run(fetch())["status"] == "success"
+    assert len(client.calls) == 2
+    assert not incident_tools._INCIDENTS_LOCKS
+
+
+def test_cached_get_incidents_releases_lock_when_fetch_raises():
+    client = FakeClient()
+    client.error = RuntimeError("network down")
+
+    async def run():
+        return await asyncio.gather(
+            *(incident_tools._cached_get_incidents(client, "Prod", 0, 1000) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(run())
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert not incident_tools._INCIDENTS_LOCKS
+
+
+INCIDENT_TS = 1767261600000  # 2026-01-01 10:00:00 (fake UTC)
+
+
+def _incident_row(timestamp, instance_name, raw_data="java.lang.OutOfMemoryError"):
+    return {
+        "timestamp": timestamp,
+        "isIncident": True,
+        "projectName": "prod-logs",
+        "projectDisplayName": "Prod Logs",
+        "componentName": "api",
+        "instanceName": instance_name,
+        "patternName": "OOM",
+        "rootCause": {"metricName": "heap_used"},
+        "rawData": raw_data,
+    }
+
+
+@pytest.fixture
+def incident_client(monkeypatch):
+    client = FakeClient([
+        _incident_row(INCIDENT_TS, "host-1"),
+        _incident_row(INCIDENT_TS + 30000, "host-2", raw_data=""),
+    ])
+
+    client.resolved = []
+
+    async def resolve_system_timezone(system_name):
+        client.resolved.append(system_name)
+        return "UTC", system_name
+
+    monkeypatch.setattr(incident_tools, "_get_api_client", lambda: client)
+    monkeypatch.setattr(incident_tools, "resolve_system_timezone", resolve_system_timezone)
+    return client
+
+
+def test_get_incident_full_builds_both_parts_from_one_fetch(incident_client):
+    full = asyncio.run(incident_tools.get_incident_full("Prod", str(INCIDENT_TS)))
+    assert full["status"] == "success"
+    assert full["details"]["incident"]["instanceName"] == "host-1"
+    assert full["raw_data"]["raw_data"] == "java.lang.OutOfMemoryError"
+    assert len(incident_client.calls) == 1
+    assert incident_client.resolved == ["Prod"]
+
+    async def run():
+        details = await incident_tools.get_incident_details("Prod", str(INCIDENT_TS))
+        raw_data = await incident_tools.get_incident_raw_data("Prod", str(INCIDENT_TS))
+        return details, raw_data
+
+    assert asyncio.run(run()) == (full["details"], full["raw_data"])
+    # The standalone tools look the incident up in the same window
+    assert len(incident_client.calls) == 1
+
+
+def test_get_incident_full_reports_missing_raw_data_alongside_details(incident_client):
+    full = asyncio.run(incident_tools.get_incident_full("Prod", str(INCIDENT_TS), instance_name="host-2"))
+    assert full["status"] == "success"
+    assert full["details"]["incident"]["instanceName"] == "host-2"
+    assert full["raw_data"] == {"status": "error", "message": "No raw data available for this incident"}
+
+
+def test_get_incident_full_returns_lookup_errors(incident_client):
+    missing = asyncio.run(incident_tools.get_incident_full("Prod", str(INCIDENT_TS + 10 * 60000)))
+    assert missing == {"status": "error", "message": "No incident found with the specified timestamp"}
+
+    incident_tools._INCIDENTS_CACHE.clear()
+    incident_client.status = "error"
+    failed = asyncio.run(incident_tools.get_incident_full("Prod", str(INCIDENT_TS)))
+    assert failed == {"status": "error", "message": "boom"}
+
+
+def test_unique_incidents_drops_repeated_ids_only():
+    rows = [
+        {"id": "a", "timestamp": 1, "rootCause": {"metricName": "cpu"}},
+        {"id": "a", "timestamp": 1, "rootCause": {"metricName": "cpu"}},
+        {"id": "b", "timestamp": 1, "rootCause": {"metricName": "memory"}},
+        # Rows without an id can't be told apart safely, so all of them are kept
+        {"timestamp": 2, "rootCause": {"metricName": "cpu"}},
+        {"timestamp": 2, "rootCause": {"metricName": "disk"}},
+    ]
+    assert list(incident_tools._unique_incidents(rows)) == [rows[0], rows[2], rows[3], rows[4]]
+
+
+def test_cached_get_incidents_drops_repeated_ids_for_every_view(incident_client):
+    rows = [_incident_row(INCIDENT_TS + n * 60000, f"host-{n}") for n in range(3)]
+    for n, row in enumerate(rows):
+        row["id"] = f"incident-{n}"
+    incident_client.rows = rows + [dict(rows[1])]
+
+    bundle = asyncio.run(incident_tools.get_incidents_bundle(
+        "Prod", str(INCIDENT_TS), str(INCIDENT_TS + 3600000)
+    ))
+    assert bundle["overview"]["summary"]["consolidated_incidents"] == 3
+    assert bundle["statistics"]["statistics"]["top_affected_instances"] == {
+        "host-0": 1, "host-1": 1, "host-2": 1,
+    }
+    assert bundle["list"]["total_found"] == 3
+    assert bundle["list"]["returned_count"] == 3
+    assert bundle["summary"]["total_found"] == 3
@@ -0,0 +1,56 @@
+import asyncio
+
+from insightfinder_mcp_server.api_client import insightfinder_client
+
+
+class FakeAsyncClient:
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.is_closed = False
+
+    async def aclose(self):
+        self.is_closed = True
+
+
+async def _shared_client(timeout=None):
+    async with insightfinder_client._http_client(timeout) as client:
+        return client
+
+
+def test_http_client_is_shared_within_a_loop(monkeypatch):
+    monkeypatch.setattr(insightfinder_client.httpx, "AsyncClient", FakeAsyncClient)
+    monkeypatch.setattr(insightfinder_client, "_HTTP_CLIENTS", {})
+
+    async def run():
+        return await _shared_client(5.0), await _shared_client(5.0), await _shared_client()
+
+    first, second, default = asyncio.run(run())
+    assert first is second
+    assert default is not first
+    assert first.kwargs["timeout"] == 5.0
+    assert "timeout" not in default.kwargs
+
+
+def test_http_client_closes_the_client_left_by_another_loop(monkeypatch):
+    monkeypatch.setattr(insightfinder_client.httpx, "AsyncClient", FakeAsyncClient)
+    monkeypatch.setattr(insightfinder_client, "_HTTP_CLIENTS", {})
+
+    first = asyncio.run(_shared_client())
+    second = asyncio.run(_shared_client())
+    assert first is not second
+    assert first.is_closed
+    assert not second.is_closed
+
+
+def test_close_http_clients_closes_the_running_loops_clients(monkeypatch):
+    monkeypatch.setattr(insightfinder_client.httpx, "AsyncClient", FakeAsyncClient)
+    monkeypatch.setattr(insightfinder_client, "_HTTP_CLIENTS", {})
+
+    async def run():
+        client = await _shared_client()
+        await insightfinder_client.close_http_clients()
+        return client
+
+    client = asyncio.run(run())
+    assert client.is_closed
+    assert not insightfinder_client._HTTP_CLIENTS